@@ -23,9 +23,20 @@ VERSION = '0.509'
 from PyQt5 import QtCore, QtGui, QtWidgets
 import sys
 import glob
-from functools import partial
+from functools import cached_property, lru_cache, partial
+from collections import OrderedDict
 import copy
 import ast
+import csv
+import inspect
+import io
+import itertools
+import operator
+import re
+import threading
+import time
+import traceback
+from types import MappingProxyType
 from os.path import expanduser
 import webbrowser
 
@@ -37,8 +48,60 @@ from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib import patheffects as PathEffects
 import xlrd
 import xlsxwriter
+from xlsxwriter.utility import xl_range_abs, xl_rowcol_to_cell
 import numpy as np
 import scipy.optimize as optim
+# pandas is optional and only used to speed up conversion of imported data
+try:
+  import pandas as pd
+except ImportError:
+  pd = None
+# fastnumbers is optional and only used to speed up conversion of pasted data
+try:
+  import fastnumbers
+except ImportError:
+  fastnumbers = None
+# numexpr is optional and only used to speed up evaluation of data transforms
+try:
+  import numexpr
+except ImportError:
+  numexpr = None
+# numba is optional and only used to compile data transforms to machine code
+try:
+  import numba
+except ImportError:
+  numba = None
+# bottleneck is optional and only used to speed up moving averages
+try:
+  import bottleneck
+except ImportError:
+  bottleneck = None
+
+# exact cell types treated as numbers (bool is deliberately excluded)
+NUMERIC_TYPES = frozenset((int, float))
+# matches strings that float() will accept as a number
+NUMBER_REGEX = re.compile(r'^\s*[+-]?(?:(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?|inf(?:inity)?|nan)\s*$', re.IGNORECASE)
+# relative step for numerical derivatives in error propagation (optimal for central differences)
+STEP_SCALE = np.cbrt(np.finfo(float).eps)
+# colors cycled through when importing data series
+CYCLE_COLORS = ((0.886, 0.290, 0.2, 1.0), (0.204, 0.541, 0.741, 1.0), (0.596, 0.557, 0.835, 1.0),\
+  (0.467, 0.467, 0.467, 1.0), (0.984, 0.757, 0.369, 1.0), (0.557, 0.729, 0.259, 1.0))
+# matplotlib 3.5+ can set tick positions and labels in a single call
+TICKS_WITH_LABELS = ('labels' in inspect.signature(matplotlib.axis.Axis.set_ticks).parameters)
+# legend settings for graphics export as Python script
+LEGEND_TEMPLATE = 'handleLegend = {axis}.legend(loc={loc!r}, shadow={shadow!r})\n'\
+  'if(handleLegend != None):\n'\
+  '\tframe = handleLegend.get_frame()\n'\
+  '\tif(frame != None):\n'\
+  '\t\tframe.set_linewidth({edgeWidth!r})\n'\
+  '\t\tframe.set_edgecolor({edge!r})\n'\
+  '\t\tframe.set_facecolor({face!r})\n'\
+  '\t\tframe.set_alpha({alpha!r})\n'\
+  '\ttexts = handleLegend.texts\n'\
+  '\tfor entry in texts:\n'\
+  '\t\tentry.set_color({labelColor!r})\n'\
+  '\t\tentry.set_fontsize({labelSize!r})\n'\
+  '\t\tentry.set_fontname({labelFont!r})\n'
 
 # reimplement FigureCanvas to optimize graphics refresh  
 class MyFigureCanvas(FigureCanvas):
@@ -61,11 +124,12 @@ class MyFigureCanvas(FigureCanvas):
         self.matplotlibCanvas.destructAboutLogo()
     
     # do we have arrows to take care of?
-    for entry in ['x', 'y']:
-      if(self.matplotlibCanvas.handleArrow[entry] != None):
-        self.matplotlibCanvas.drawAxisArrow(axis=entry, redraw=False, target='plot')
-      if(self.matplotlibCanvas.handleArrowResid[entry] != None):
-        self.matplotlibCanvas.drawAxisArrow(axis=entry, redraw=False, target='resid')
+    if(self.matplotlibCanvas.hasArrows):
+      for entry in ('x', 'y'):
+        if(self.matplotlibCanvas.handleArrow[entry] != None):
+          self.matplotlibCanvas.drawAxisArrow(axis=entry, redraw=False, target='plot')
+        if(self.matplotlibCanvas.handleArrowResid[entry] != None):
+          self.matplotlibCanvas.drawAxisArrow(axis=entry, redraw=False, target='resid')
 
     # the actual draw command
     self.draw()
@@ -115,10 +179,12 @@ class KuhMenu(QtWidgets.QMenu):
 class FloatFormatDelegate(QtWidgets.QStyledItemDelegate):
   def __init__(self):
     super(FloatFormatDelegate, self).__init__()
+    # C locale formats with decimal point and without group separators
+    self.floatLocale = QtCore.QLocale(QtCore.QLocale.C)
 
   def displayText(self, value, locale):
     if(type(value) == float):
-      return QtWidgets.QStyledItemDelegate.displayText(self, value, locale).replace(',', '.')
+      return self.floatLocale.toString(value, 'g', 6)
     else:
       return QtWidgets.QStyledItemDelegate.displayText(self, value, locale)
   
@@ -132,26 +198,71 @@ class TableModel(QtCore.QAbstractTableModel):
       self._data = data.tolist()
     else:
       self._data = data
+    # rows are exposed to views in batches of fetchSize
+    self.fetchSize = 200
+    self._visibleRows = 0
+    self.updateDimensions()
+    self.invalidateNumeric()
     self.headers = [str(i+1) for i in range(self.columnCount())]
 
+  def updateDimensions(self):
+    # cache table dimensions as Qt polls rowCount/columnCount very frequently
+    self._nrows = len(self._data)
+    self._ncols = len(self._data[0]) if self._nrows else 0
+    self._visibleRows = min(self._nrows, max(self._visibleRows, self.fetchSize))
+
+  def invalidateNumeric(self):
+    # numerical state of table is only determined once needed
+    self._numeric, self._dataNum = None, None
+
+  def checkNumeric(self):
+    # lazily build a contiguous float copy of purely numerical tables for fast row retrieval
+    if(self._numeric == None):
+      self._numeric = bool(self._nrows) and all((len(row) == self._ncols) and all(type(item) == float for item in row) for row in self._data)
+      if(self._numeric):
+        self._dataNum = np.array(self._data, dtype=float)
+    return self._numeric
+
   def rowCount(self, parent=None):
-    return len(self._data)
+    # number of rows currently exposed to views
+    return self._visibleRows
+
+  def totalRowCount(self):
+    return self._nrows
+
+  def canFetchMore(self, parent=None):
+    return self._visibleRows < self._nrows
+
+  def fetchMore(self, parent=None):
+    # exposes next batch of rows
+    self.fetchRows(min(self._nrows, self._visibleRows + self.fetchSize))
+
+  def fetchAll(self):
+    # exposes all rows
+    self.fetchRows(self._nrows)
+
+  def fetchTo(self, row):
+    # exposes rows up to and including target row
+    self.fetchRows(min(self._nrows, row + 1))
+
+  def fetchRows(self, targetRows):
+    if(targetRows > self._visibleRows):
+      self.beginInsertRows(QtCore.QModelIndex(), self._visibleRows, targetRows - 1)
+      self._visibleRows = targetRows
+      self.endInsertRows()
 
   def columnCount(self, parent=None):
-    return len(self._data[0]) if self.rowCount() else 0
+    return self._ncols
 
   def data(self, index, role=QtCore.Qt.DisplayRole):
     if role == QtCore.Qt.DisplayRole:
-      row = index.row()
-      if 0 <= row < self.rowCount():
-        column = index.column()
-        if 0 <= column < self.columnCount():
-          return self._data[row][column]
+      row, column = index.row(), index.column()
+      if((0 <= row < self._nrows) and (0 <= column < self._ncols)):
+        return self._data[row][column]
         
   def dataByIndices(self, row=0, column=0):
-    if 0 <= row < self.rowCount():
-      if 0 <= column < self.columnCount():
-        return self._data[row][column]
+    if((0 <= row < self._nrows) and (0 <= column < self._ncols)):
+      return self._data[row][column]
         
   def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
     if role == QtCore.Qt.DisplayRole and orientation == QtCore.Qt.Horizontal:
@@ -171,9 +282,20 @@ class TableModel(QtCore.QAbstractTableModel):
       self.headers[index] = label
       
   def getDataRows(self, indices):
-    retv = [self._data[index] for index in indices]
+    if(self.checkNumeric()):
+      retv = self._dataNum[np.asarray(indices, dtype=int)].tolist()
+    else:
+      retv = [self._data[index] for index in indices]
     return retv
 
+  def isNumeric(self):
+    return self.checkNumeric()
+
+  def getDataArray(self, indices, columns):
+    # returns float array of selected rows and columns (only for purely numerical tables)
+    self.checkNumeric()
+    return self._dataNum[np.ix_(np.asarray(indices, dtype=int), np.asarray(columns, dtype=int))]
+
   def getHeaders(self):
     return self.headers
 
@@ -181,24 +303,110 @@ class TableModel(QtCore.QAbstractTableModel):
     return self._data
   
   def setData(self, value, row, column):
-    if((0 <= row < self.rowCount()) and (0 <= column < self.columnCount())):
+    # returns whether cell contents actually changed
+    if((0 <= row < self._nrows) and (0 <= column < self._ncols)):
+      prevValue = self._data[row][column]
+      if((type(prevValue) == type(value)) and (prevValue == value)):
+        return False
       self._data[row][column] = value
+      if(self._numeric):
+        if(type(value) == float):
+          self._dataNum[row, column] = value
+        else:
+          self._numeric, self._dataNum = False, None
+      return True
+    return False
+
+  def replaceData(self, data):
+    # swaps in new table contents without setting up a new model
+    if(hasattr(data, 'tolist')):
+      data = data.tolist()
+    prevDimensions = (self._nrows, self._ncols)
+    newDimensions = (len(data), len(data[0]) if len(data) else 0)
+    if(newDimensions != prevDimensions):
+      # dimensions change => views have to reset
+      self.beginResetModel()
+      self._data = data
+      self._visibleRows = 0
+      self.updateDimensions()
+      self.invalidateNumeric()
+      self.headers = self.headers[:self._ncols] + [str(i+1) for i in range(len(self.headers), self._ncols)]
+      self.endResetModel()
+    else:
+      self._data = data
+      self.invalidateNumeric()
+      if(self._visibleRows and self._ncols):
+        self.dataChanged.emit(self.index(0, 0), self.index(self._visibleRows - 1, self._ncols - 1), [QtCore.Qt.DisplayRole])
+
+  def appendRows(self, count):
+    # grows table by blank rows in place
+    if(count > 0):
+      # new rows are only exposed directly if all rows are already visible
+      exposeRows = (self._visibleRows == self._nrows)
+      if(exposeRows):
+        self.beginInsertRows(QtCore.QModelIndex(), self._nrows, self._nrows + count - 1)
+      self._data.extend([[''] * self._ncols for i in range(count)])
+      self._nrows += count
+      if(exposeRows):
+        self._visibleRows = self._nrows
+        self.endInsertRows()
+      self._numeric, self._dataNum = False, None
+
+  def appendColumns(self, count):
+    # grows table by blank columns in place
+    if(count > 0):
+      self.beginInsertColumns(QtCore.QModelIndex(), self._ncols, self._ncols + count - 1)
+      for row in self._data:
+        row.extend([''] * count)
+      self.headers = self.headers[:self._ncols] + [str(i+1) for i in range(self._ncols, self._ncols + count)]
+      self._ncols += count
+      self.endInsertColumns()
+      self._numeric, self._dataNum = False, None
 
   def pasteDataBlock(self, data, offsetRow=0, offsetColumn=0):
+    firstRow, maxItems, prevColumns = offsetRow, 0, self._ncols
     for row in data:
-      if(offsetRow < self.rowCount()):
+      if(offsetRow < self._nrows):
         rowItems = len(row)
         self._data[offsetRow][offsetColumn:offsetColumn + rowItems] = row
+        maxItems = max(maxItems, rowItems)
       offsetRow += 1
+    # slice assignment may have widened the table
+    self.updateDimensions()
+    if(self._numeric and (offsetColumn + maxItems <= prevColumns) and all(type(item) == float for row in data for item in row)):
+      # table stays numerical => only update pasted block of float copy
+      for index, row in enumerate(data[:self._nrows - firstRow]):
+        self._dataNum[firstRow + index, offsetColumn:offsetColumn + len(row)] = row
+    else:
+      self.invalidateNumeric()
+    # notify views once for entire block
+    lastRow, lastCol = min(offsetRow, self._visibleRows) - 1, min(offsetColumn + maxItems, self._ncols) - 1
+    if((lastRow >= firstRow) and (lastCol >= offsetColumn)):
+      self.dataChanged.emit(self.index(firstRow, offsetColumn), self.index(lastRow, lastCol), [QtCore.Qt.DisplayRole])
 
 # a custom cursor
 class MyCursor(matplotlib.widgets.Cursor):
+  # number formats for cross hair label
+  NUMBER_SWITCH = 1e3
+  FORMAT_DECIMAL = '{:.3f}'.format
+  FORMAT_SCIENTIFIC = '{:.3e}'.format
+
   def __init__(self, *args, **kwargs):
     super(MyCursor, self).__init__(*args, **kwargs)
     self.label = self.ax.text(1, 1, 'Hallo', animated=True)
     self.label.set_fontsize(scaledDPI(12))
     # need to store background for initial creation of cursor
     self.background = self.canvas.copy_from_bbox(self.ax.bbox)
+    # mouse moves faster than screen refreshes => coalesce blits
+    self.blitInterval = 1.0 / 60.0
+    self.lastBlit = 0.0
+    self.blitPending = False
+    # remember current cross hair color to avoid needless restyling
+    self.crossHairColor = None
+    # cache center of axes (in display coordinates) which only changes upon redraw/resize
+    self.bboxCenter = None
+    self.connect_event('draw_event', self.invalidateBboxCenter)
+    self.connect_event('resize_event', self.invalidateBboxCenter)
     
   def onmove(self, event):
     """on mouse motion draw the cursor if visible"""
@@ -243,19 +451,28 @@ class MyCursor(matplotlib.widgets.Cursor):
       color = 'black'
     else:
       color = 'white'
-    self.label.set_color(color)
-    self.lineh.set_color(color)
-    self.linev.set_color(color)
+    if(color != self.crossHairColor):
+      self.label.set_color(color)
+      self.lineh.set_color(color)
+      self.linev.set_color(color)
+      self.crossHairColor = color
     # check quadrant of plot
-    if(event.x > ((self.ax.bbox.xmin + self.ax.bbox.xmax) / 2.0)):
+    if(self.bboxCenter == None):
+      bbox = self.ax.bbox
+      self.bboxCenter = ((bbox.xmin + bbox.xmax) / 2.0, (bbox.ymin + bbox.ymax) / 2.0)
+    if(event.x > self.bboxCenter[0]):
       self.label.set_horizontalalignment('right')
     else:
       self.label.set_horizontalalignment('left')
-    if(event.y > ((self.ax.bbox.ymin + self.ax.bbox.ymax) / 2.0)):
+    if(event.y > self.bboxCenter[1]):
       self.label.set_verticalalignment('top')
     else:
       self.label.set_verticalalignment('bottom')
 
+  def invalidateBboxCenter(self, event=None):
+    # forces recalculation of axes center on next mouse move
+    self.bboxCenter = None
+
   def getHandles(self):
     # returns handles to graphics elements
     handles = [self.linev, self.lineh, self.label]
@@ -263,6 +480,14 @@ class MyCursor(matplotlib.widgets.Cursor):
 
   def _update(self):
     if self.useblit:
+      # skip blit if last one was too recent but make sure final position gets drawn
+      now = time.monotonic()
+      if(now - self.lastBlit < self.blitInterval):
+        if(not self.blitPending):
+          self.blitPending = True
+          QtCore.QTimer.singleShot(int(1000 * self.blitInterval) + 1, self.deferredUpdate)
+        return False
+      self.lastBlit = now
       if self.background is not None:
         self.canvas.restore_region(self.background)
       self.ax.draw_artist(self.linev)
@@ -274,6 +499,11 @@ class MyCursor(matplotlib.widgets.Cursor):
 
     return False
 
+  def deferredUpdate(self):
+    # performs blit that was held back by _update
+    self.blitPending = False
+    self._update()
+
   def toggleVisibility(self, state=False, event=None):
     self.visible = state
     if(self.visible and (event != None)):
@@ -288,34 +518,23 @@ class MyCursor(matplotlib.widgets.Cursor):
 
   def formatNumber(self, number):
     # formats number for output
-    NUMBER_SWITCH = 1e3
-    FORMAT_DECIMAL = '{:.3f}'
-    FORMAT_SCIENTIFIC = '{:.3e}'
     # determine return string
     if((self.isNumber(number)) and (np.isfinite(float(number)))):
-      if((np.abs(number)>NUMBER_SWITCH) or (np.abs(number)<1.0/NUMBER_SWITCH)):
-        numberstr = FORMAT_SCIENTIFIC.format(number)
+      if((abs(number) > self.NUMBER_SWITCH) or (abs(number) < 1.0 / self.NUMBER_SWITCH)):
+        numberstr = self.FORMAT_SCIENTIFIC(number)
       else:
-        numberstr = FORMAT_DECIMAL.format(number)
+        numberstr = self.FORMAT_DECIMAL(number)
     else:
       numberstr = str(number)
     
     return numberstr
 
   def isNumber(self, s):
-    # checks whether string is a number
-    try:
-      float(s)
+    # checks whether string is a number (usually called with matplotlib's float coordinates)
+    if(isinstance(s, (int, float, np.integer, np.floating))):
       return True
-    except ValueError:
-      pass
-   
-    try:
-      import unicodedata
-      unicodedata.numeric(s)
+    if((type(s) == str) and (NUMBER_REGEX.match(s))):
       return True
-    except (TypeError, ValueError):
-      pass
     
     return False
   
@@ -348,22 +567,30 @@ class DataTable(QtWidgets.QTableView):
     self.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
     self.parent = parent
     self.tableModel = None
+    self.connectedSelectionModel = None
     self.currentRow, self.currentCol = 0, 0
     self.pageStep = 20
+    # select all also covers rows not yet fetched by view
+    self.allRowsSelected = False
+    self.selectingAll = False
+    # parsed sheets of current Excel file (least recently used ones are dropped first)
+    self.sheetCache = OrderedDict()
+    self.sheetCacheSize = 8
     # connect click event on table header
     hheader = self.horizontalHeader()
     hheader.sectionClicked.connect(self.changeRole)
 
   def configTable(self, dimx, dimy, retainRoles=False, retainSelection=False, init=False):
     # helper function called by different file importers
+    # ensure model is set before we deal with selection model
+    self.setModel(self.tableModel)
     # set row height and prevent from resizing
     self.rowHeight = int(self.fontMetrics().height() + scaledDPI(2))
     if(init):
       self.rowHeight = scaledDPI(18)
     vheader = self.verticalHeader()
     vheader.setDefaultSectionSize(self.rowHeight)
-    for entry in range(dimy):
-      vheader.setSectionResizeMode(entry, QtWidgets.QHeaderView.Fixed)
+    vheader.setSectionResizeMode(QtWidgets.QHeaderView.Fixed)
       
     # set col width
     self.colWidth = int(self.size().width() / 4.5)
@@ -378,9 +605,12 @@ class DataTable(QtWidgets.QTableView):
     if(not retainSelection):
       self.selectAll()
     
-    # connect event for selection update
-    self.selectionModel().selectionChanged.connect(partial(self.parent.updateData, True))
-    self.selectionModel().currentChanged.connect(self.currentCellChanged)
+    # connect event for selection update (only once per selection model, otherwise updates pile up)
+    if(self.selectionModel() is not self.connectedSelectionModel):
+      self.connectedSelectionModel = self.selectionModel()
+      self.connectedSelectionModel.selectionChanged.connect(self.selectionAltered)
+      self.connectedSelectionModel.selectionChanged.connect(partial(self.parent.updateData, True))
+      self.connectedSelectionModel.currentChanged.connect(self.currentCellChanged)
     
     # assign roles to columns (-1 means role is undefined)
     if(retainRoles):
@@ -408,48 +638,44 @@ class DataTable(QtWidgets.QTableView):
       if(self.roles[key]+1):
         headerData[self.roles[key]] = str(self.roles[key]+1)+' ('+self.rolestr[key]+')'
     self.tableModel.setAllHeaders(headerData)
-    self.setModel(self.tableModel)
 
     self.setItemDelegate(FloatFormatDelegate())
     self.setFocus()
 
   def killTheComma(self):
     # processes sheet data and replaces all commata by period
-    if(len(self.sheetData)):
-      dimx, dimy = len(self.sheetData[0]), len(self.sheetData)
-      nuData = []
-      for row in self.sheetData:
-        nuData.append([self.killHelper(i) for i in row])
+    if((self.tableModel != None) and (self.tableModel.totalRowCount())):
+      nuData = np.array(self.tableModel.getAllData(), dtype=object)
+      # locate text cells that contain a comma
+      commaCells = np.frompyfunc(lambda item: (type(item) == str) and (',' in item), 1, 1)(nuData).astype(bool)
+      if(np.any(commaCells)):
+        origItems = nuData[commaCells]
+        convItems = np.char.replace(origItems.astype(str), ',', '.')
+        # convert to number where possible, otherwise retain original text
+        if(pd != None):
+          # same conversion rules as float() (i.e., also accept nan and inf)
+          isNumber = pd.Series(convItems).str.match(NUMBER_REGEX).values
+          numbers = pd.to_numeric(np.where(isNumber, convItems, ''), errors='coerce')
+          nuData[commaCells] = np.where(isNumber, numbers.astype(object), origItems)
+        else:
+          nuData[commaCells] = [float(i) if NUMBER_REGEX.match(i) else j for i, j in zip(convItems, origItems)]
         
-      self.sheetData = nuData
-      self.tableModel = TableModel(self.sheetData, self)
-      self.configTable(dimx, dimy, retainRoles=True, retainSelection=False)
-      self.selectAll()
-
-      nuIndex = self.model().index(self.currentRow, self.currentCol)
-      self.selectionModel().setCurrentIndex(nuIndex, QtCore.QItemSelectionModel.Select)
-      self.tableModel.layoutChanged.emit()
+        # only cell values change => update model in place rather than setting up a new one
+        self.sheetData = nuData.tolist()
+        self.tableModel.replaceData(self.sheetData)
       
-      # for some strange reason we have to connect the event again, grrrr! (should've been done in self.configTable())
-      self.selectionModel().currentChanged.connect(self.currentCellChanged)
+      # select all rows and (re)import data
+      allSelected = (len(self.getSelectedRows()) == self.tableModel.totalRowCount())
+      self.selectAll()
+      if(allSelected):
+        # selection did not change and thus won't trigger update
+        self.parent.updateData(True)
       
-  def killHelper(self, item):
-    if(type(item) in [int, float]):
-      return item
-    elif((type(item) == str) and (',' in item)):
-      convItem = item.replace(',', '.')
-      try:
-        convItem = float(convItem)
-        return convItem
-      except:
-        return item
-    else:
-      return item
-
   def generateEmptyTable(self, columnCount=4, rowCount=20):
     # intializes blank table
-    blankData = [[''] * columnCount for i in range(rowCount)]
-    self.sheetData = blankData
+    blankData = np.empty((rowCount, columnCount), dtype=object)
+    blankData.fill('')
+    self.sheetData = blankData.tolist()
     self.tableModel = TableModel(self.sheetData, self)
     self.setModel(self.tableModel)
     self.configTable(columnCount, rowCount, init=True)
@@ -486,6 +712,7 @@ class DataTable(QtWidgets.QTableView):
       self.parent.parent.statusbar.showMessage('Cannot load file ' + filename, self.parent.parent.STATUS_TIME)
     else:
       self.sheetNames = self.wb.sheet_names()
+      self.sheetCache.clear()
       
       # update number of available sheets and current sheet
       self.parent.resetSheetSpinBox(currVal=1, maxVal=self.wb.nsheets, currName=self.sheetNames[0])
@@ -495,20 +722,8 @@ class DataTable(QtWidgets.QTableView):
       (dimx, dimy) = (self.sheet.ncols, self.sheet.nrows)
       
       # populate the table
-      self.sheetData = []
-      for entry in range(dimy):
-        row = self.sheet.row_values(entry)
-        self.sheetData.append(row)
-        
-      # transpose data?
-      if((transpose) and (len(self.sheetData))):
-        transposedData = []
-        for entry1 in range(len(self.sheetData[0])):
-          row = []
-          for entry2 in range(len(self.sheetData)):
-            row.append(self.sheetData[entry2][entry1])
-          transposedData.append(row)
-        self.sheetData = transposedData
+      self.sheetData = self.getSheetData(0, transpose=transpose)
+      if(transpose):
         dimx, dimy = dimy, dimx
       
       self.tableModel = TableModel(self.sheetData, self)
@@ -519,6 +734,31 @@ class DataTable(QtWidgets.QTableView):
 
     QtWidgets.QApplication.restoreOverrideCursor()
   
+  def getSheetData(self, index=0, transpose=False):
+    # returns contents of Excel sheet, parsing it only upon first visit
+    key = (index, transpose)
+    if(key in self.sheetCache):
+      self.sheetCache.move_to_end(key)
+    else:
+      self.sheetCache[key] = np.array(self.ingestSheet(self.wb.sheet_by_index(index), transpose=transpose), dtype=object)
+      if(len(self.sheetCache) > self.sheetCacheSize):
+        self.sheetCache.popitem(last=False)
+    # hand out fresh nested list as table edits modify data in place
+    return self.sheetCache[key].tolist()
+
+  def ingestSheet(self, sheet, transpose=False):
+    # reads all rows of Excel sheet in one go
+    sheetData = [sheet.row_values(entry) for entry in range(sheet.nrows)]
+    if(transpose):
+      sheetData = self.transposeHelper(sheetData)
+    return sheetData
+
+  def transposeHelper(self, data):
+    # transposes nested list (let numpy do the index shuffling)
+    if(len(data)):
+      return np.array(data, dtype=object).T.tolist()
+    return data
+
   def changeSheet(self, currVal=1, transpose=False):
     # update number of available sheets and current sheet
     self.parent.resetSheetSpinBox(currVal=currVal, maxVal=self.wb.nsheets, currName=self.sheetNames[currVal - 1])
@@ -528,20 +768,8 @@ class DataTable(QtWidgets.QTableView):
     (dimx, dimy) = (self.sheet.ncols, self.sheet.nrows)
     
     # populate the table
-    self.sheetData = []
-    for entry in range(dimy):
-      row = self.sheet.row_values(entry)
-      self.sheetData.append(row)
-    
-    # transpose data?
-    if((transpose) and (len(self.sheetData))):
-      transposedData = []
-      for entry1 in range(len(self.sheetData[0])):
-        row = []
-        for entry2 in range(len(self.sheetData)):
-          row.append(self.sheetData[entry2][entry1])
-        transposedData.append(row)
-      self.sheetData = transposedData
+    self.sheetData = self.getSheetData(currVal - 1, transpose=transpose)
+    if(transpose):
       dimx, dimy = dimy, dimx
       
     self.tableModel = TableModel(self.sheetData, self)
@@ -557,13 +785,7 @@ class DataTable(QtWidgets.QTableView):
       
       # transpose data
       if(len(currData)):
-        transposedData = []
-        for entry1 in range(len(currData[0])):
-          row = []
-          for entry2 in range(len(currData)):
-            row.append(currData[entry2][entry1])
-          transposedData.append(row)
-        self.sheetData = transposedData
+        self.sheetData = self.transposeHelper(currData)
         dimx, dimy = len(self.sheetData[0]), len(self.sheetData)
         
       self.tableModel = TableModel(self.sheetData, self)
@@ -577,45 +799,40 @@ class DataTable(QtWidgets.QTableView):
     QtWidgets.QApplication.setOverrideCursor(QtGui.QCursor(QtCore.Qt.WaitCursor))
     QtCore.QCoreApplication.processEvents()
     try:
-      # try opening text file
-      readhandle = open(filename, 'r')
-      filecontent = readhandle.readlines()
+      # stream text file through csv parser (trailing whitespace is ignored)
+      with open(filename, 'r') as readhandle:
+        reader = csv.reader((line.rstrip() for line in readhandle), delimiter=delimiter, quoting=csv.QUOTE_NONE)
+        if(pd != None):
+          rows = list(reader)
+        else:
+          rows = [[float(i) if NUMBER_REGEX.match(i) else i for i in row] for row in reader]
     except:
       self.parent.parent.statusbar.showMessage('Cannot load file ' + filename, self.parent.parent.STATUS_TIME)
     else:
-      readhandle.close()
-      
       # determine row and col count
-      filecontent = [i.rstrip() for i in filecontent]
-      dimy = len(filecontent)
-      dimx = max([i.count(delimiter) for i in filecontent]) + 1
+      dimy = len(rows)
+      dimx = max([len(i) for i in rows] + [1])
 
       # turn off multiple sheet option
       self.parent.resetSheetSpinBox(currVal=1, maxVal=1, currName='')
       
       # populate the table
-      maxNumberItems = 0
-      self.sheetData = []
-      for row in filecontent:
-        splitline = row.split(delimiter)
-        splitline = [float(i) if self.isNumber(i) else i for i in splitline]
-        self.sheetData.append(splitline)
-        maxNumberItems = np.max((maxNumberItems, len(splitline)))
-      
-      # fill sheetData with empty cells to make square (otherwise will have problems in TableModel)
-      for entry in self.sheetData:
-        while(len(entry) < maxNumberItems):
-          entry.append('')
+      if((pd != None) and (dimy)):
+        # convert to number where possible (DataFrame pads ragged rows to make square)
+        frame = pd.DataFrame(rows, columns=range(dimx)).fillna('')
+        # same conversion rules as float() (i.e., also accept nan and inf)
+        isNumber = frame.apply(lambda column: column.str.match(NUMBER_REGEX))
+        numbers = frame.where(isNumber, '').apply(pd.to_numeric, errors='coerce').astype(float)
+        self.sheetData = numbers.astype(object).where(isNumber, frame).values.tolist()
+      else:
+        # fill with empty cells to make square (otherwise will have problems in TableModel)
+        for entry in rows:
+          entry.extend([''] * (dimx - len(entry)))
+        self.sheetData = rows
 
       # transpose data?
       if((transpose) and (len(self.sheetData))):
-        transposedData = []
-        for entry1 in range(len(self.sheetData[0])):
-          row = []
-          for entry2 in range(len(self.sheetData)):
-            row.append(self.sheetData[entry2][entry1])
-          transposedData.append(row)
-        self.sheetData = transposedData
+        self.sheetData = self.transposeHelper(self.sheetData)
         dimx, dimy = dimy, dimx
 
       self.tableModel = TableModel(self.sheetData, self)
@@ -684,63 +901,63 @@ class DataTable(QtWidgets.QTableView):
     # trigger data update
     self.parent.updateData(docheck = True)
 
+  def getSelectedRows(self):
+    # returns sorted indices of selected rows (all rows of table if everything was selected)
+    selind = sorted([i.row() for i in self.selectionModel().selectedRows()])
+    if(self.allRowsSelected and (len(selind) == self.tableModel.rowCount())):
+      selind = list(range(self.tableModel.totalRowCount()))
+    return selind
+
   def hasComma(self):
-    # cycles through selected cells and checks for presence of comma
-    selind = self.selectionModel().selectedIndexes()
-    retv = False
-    index = 0
-    while((not retv) and (index < len(selind))):
-      if((type(selind[index].data()) == str) and (',' in selind[index].data())):
-        retv = True
-      index += 1
+    # cycles through selected cells and checks for presence of comma (directly on model data)
+    selcells = [(index.row(), index.column()) for index in self.selectionModel().selectedIndexes()]
+    if(self.allRowsSelected and (len(set([row for row, column in selcells])) == self.tableModel.rowCount())):
+      # entire table selected => also check selected columns of rows not yet fetched by view
+      columns = sorted(set([column for row, column in selcells]))
+      selcells = ((row, column) for row in range(self.tableModel.totalRowCount()) for column in columns)
+    data = self.tableModel.getAllData()
+    retv = any(((type(data[row][column]) == str) and (',' in data[row][column])) for row, column in selcells)
 
     return retv
     
   def getData(self):
     # returns selected data as numpy array
     # determine selected rows
-    selind = self.selectionModel().selectedRows()
-    selind = sorted([i.row() for i in selind])
+    selind = self.getSelectedRows()
      
     # retrieve data from table
     retv = []; roles = []
     # check whether at least x and y assigned
     if ((self.roles['x']+1) and (self.roles['y']+1)):
-      if (len(selind)):
+      if (len(selind) and self.tableModel.isNumeric()):
+        # purely numerical table => slice contiguous float copy directly
+        activeKeys = [key for key in ['x', 'xerr', 'y', 'yerr'] if (self.roles[key] > -1)]
+        indices = [self.roles[key] for key in activeKeys]
+        roles = activeKeys
+        if(self.roles['labels'] > -1):
+          indices.append(self.roles['labels'])
+          roles.append('labels')
+        retv = self.tableModel.getDataArray(selind, indices)
+      elif (len(selind)):
         # get all selected data rows
-        selectedData = self.tableModel.getDataRows(selind)
+        selectedData = np.array(self.tableModel.getDataRows(selind), dtype=object)
 
         # deal with labels separately to allow non-numerical entries here
         if(self.roles['labels'] > -1):
-          selectedLabels = []
-          index = self.roles['labels']
-          for entry in selectedData:
-            selectedLabels.append(entry[index])
+          selectedLabels = selectedData[:, self.roles['labels']]
         
         # reduce data to columns we are interested in
         activeKeys = [key for key in ['x', 'xerr', 'y', 'yerr'] if (self.roles[key] > -1)]
         indices = [self.roles[key] for key in activeKeys]
-        for index, entry in enumerate(selectedData):
-          selectedData[index] = [entry[i] for i in indices]
+        selectedData = selectedData[:, indices]
           
-        # prepare list for numpy array
-        prunedData = []; no_items = len(activeKeys)
-        for index, row in enumerate(selectedData):
-          types = [1 if type(i) in [int, float] else 0 for i in row]
-          if(np.sum(types) == no_items):
-            # only numerical entries on row
-            if(self.roles['labels'] > -1):
-              row.append(selectedLabels[index])
-            prunedData.append(row)
-          elif(np.sum(types) > 0):
-            # at least one numerical entry on row
-            lengths = [len(i) for index, i in enumerate(row) if(not types[index])]
-            if(np.sum(lengths) == 0):
-              # all other cells empty => replace by zero
-              row = [i if types[index] else 0.0 for index, i in enumerate(row)]
-              if(self.roles['labels'] > -1):
-                row.append(selectedLabels[index])
-              prunedData.append(row)
+        # keep rows with at least one numerical entry whose other cells are empty (those are replaced by zero)
+        isNumeric = np.vectorize(lambda item: type(item) in NUMERIC_TYPES, otypes=[bool])(selectedData)
+        isEmpty = (selectedData == '')
+        keepRows = np.all(isNumeric | isEmpty, axis=1) & np.any(isNumeric, axis=1)
+        prunedData = np.where(isNumeric, selectedData, 0.0)[keepRows].tolist()
+        if(self.roles['labels'] > -1):
+          prunedData = [row + [label] for row, label in zip(prunedData, selectedLabels[keepRows].tolist())]
         
         # convert nested list to numpy array
         retv = prunedData
@@ -758,15 +975,10 @@ class DataTable(QtWidgets.QTableView):
   def keyPressEvent(self, event):
     if event.matches(QtGui.QKeySequence.Copy):
       # prepare output
-      selind = self.selectionModel().selectedRows()
-      selind = sorted([i.row() for i in selind])      
+      selind = self.getSelectedRows()
       # get data
       selectedData = self.tableModel.getDataRows(selind)
-      output = []
-      for row in selectedData:
-        row = [str(i) for i in row]
-        output.append('\t'.join(row))
-      output = '\n'.join(output)
+      output = '\n'.join(['\t'.join(map(str, row)) for row in selectedData])
       clipboard = QtWidgets.QApplication.clipboard()
       clipboard.setText(output)
     elif event.matches(QtGui.QKeySequence.Paste):
@@ -779,44 +991,36 @@ class DataTable(QtWidgets.QTableView):
     elif event.matches(QtGui.QKeySequence.SelectAll):
       self.selectAll()
     elif(event.key() == QtCore.Qt.Key_Down):
-      if(self.currentRow < self.tableModel.rowCount() - 1):
-        if(not (event.modifiers() & QtCore.Qt.ShiftModifier)):
-          self.clearSelection()
+      if(self.currentRow < self.tableModel.totalRowCount() - 1):
         self.currentRow += 1
-        self.selectTo(self.currentRow, self.currentRow)
+        self.selectTo(self.currentRow, self.currentRow, clear=not (event.modifiers() & QtCore.Qt.ShiftModifier))
         nuIndex = self.model().index(self.currentRow, self.currentCol)
         self.selectionModel().setCurrentIndex(nuIndex, QtCore.QItemSelectionModel.Select)
     elif(event.key() == QtCore.Qt.Key_Up):
       if(self.currentRow > 0):
-        if(not (event.modifiers() & QtCore.Qt.ShiftModifier)):
-          self.clearSelection()
         self.currentRow -= 1
-        self.selectTo(self.currentRow, self.currentRow)
+        self.selectTo(self.currentRow, self.currentRow, clear=not (event.modifiers() & QtCore.Qt.ShiftModifier))
         
         nuIndex = self.model().index(self.currentRow, self.currentCol)
         self.selectionModel().setCurrentIndex(nuIndex, QtCore.QItemSelectionModel.Select)
     elif(event.key() == QtCore.Qt.Key_PageDown):
-      if(self.currentRow < self.tableModel.rowCount() - 1):
-        if(not (event.modifiers() & QtCore.Qt.ShiftModifier)):
-          self.clearSelection()
+      if(self.currentRow < self.tableModel.totalRowCount() - 1):
         origRow = self.currentRow
         self.currentRow += self.pageStep
-        self.currentRow = min(self.currentRow, self.tableModel.rowCount() - 1)
+        self.currentRow = min(self.currentRow, self.tableModel.totalRowCount() - 1)
         if(not (event.modifiers() & QtCore.Qt.ShiftModifier)):
           origRow = self.currentRow
-        self.selectTo(origRow, self.currentRow)
+        self.selectTo(origRow, self.currentRow, clear=not (event.modifiers() & QtCore.Qt.ShiftModifier))
         nuIndex = self.model().index(self.currentRow, self.currentCol)
         self.selectionModel().setCurrentIndex(nuIndex, QtCore.QItemSelectionModel.Select)
     elif(event.key() == QtCore.Qt.Key_PageUp):
       if(self.currentRow > 0):
-        if(not (event.modifiers() & QtCore.Qt.ShiftModifier)):
-          self.clearSelection()
         origRow = self.currentRow
         self.currentRow -= self.pageStep
         self.currentRow = max(self.currentRow, 0)
         if(not (event.modifiers() & QtCore.Qt.ShiftModifier)):
           origRow = self.currentRow
-        self.selectTo(origRow, self.currentRow)
+        self.selectTo(origRow, self.currentRow, clear=not (event.modifiers() & QtCore.Qt.ShiftModifier))
         nuIndex = self.model().index(self.currentRow, self.currentCol)
         self.selectionModel().setCurrentIndex(nuIndex, QtCore.QItemSelectionModel.Select)
     elif(event.key() in [QtCore.Qt.Key_Left, QtCore.Qt.Key_Right]):
@@ -841,15 +1045,14 @@ class DataTable(QtWidgets.QTableView):
             origRow = self.currentRow
             self.currentRow = 0
             flag = True
-        elif(self.currentRow < self.tableModel.rowCount() - 1):
+        elif(self.currentRow < self.tableModel.totalRowCount() - 1):
           origRow = self.currentRow
-          self.currentRow = self.tableModel.rowCount() - 1
+          self.currentRow = self.tableModel.totalRowCount() - 1
           flag = True
         if(flag):
           if(not (event.modifiers() & QtCore.Qt.ShiftModifier)):
-            self.clearSelection()
             origRow = self.currentRow
-          self.selectTo(origRow, self.currentRow)
+          self.selectTo(origRow, self.currentRow, clear=not (event.modifiers() & QtCore.Qt.ShiftModifier))
           nuIndex = self.model().index(self.currentRow, self.currentCol)
           self.selectionModel().setCurrentIndex(nuIndex, QtCore.QItemSelectionModel.Select)
       else:
@@ -866,32 +1069,32 @@ class DataTable(QtWidgets.QTableView):
           self.selectionModel().setCurrentIndex(nuIndex, QtCore.QItemSelectionModel.Select)
     elif(event.key() in [QtCore.Qt.Key_Tab, QtCore.Qt.Key_Backtab]):
       # advance cell on tab
+      rowCount, colCount = self.tableModel.totalRowCount(), self.tableModel.columnCount()
       if(event.key() == QtCore.Qt.Key_Backtab):
         self.currentCol -= 1
         if(self.currentCol < 0):
           if(self.currentRow > 0):
             self.currentRow -= 1
-            self.currentCol = self.tableModel.columnCount() - 1
+            self.currentCol = colCount - 1
           else:
             self.currentCol = 0
       else:
         self.currentCol += 1
-        if(self.currentCol >= self.tableModel.columnCount()):
-          if(self.currentRow < self.tableModel.rowCount() - 1):
+        if(self.currentCol >= colCount):
+          if(self.currentRow < rowCount - 1):
             self.currentRow += 1
             self.currentCol = 0
           else:
-            self.currentCol = self.tableModel.columnCount() - 1
-      self.clearSelection()
-      self.selectTo(self.currentRow, self.currentRow)
+            self.currentCol = colCount - 1
+      self.selectTo(self.currentRow, self.currentRow, clear=True)
       nuIndex = self.model().index(self.currentRow, self.currentCol)
       self.selectionModel().setCurrentIndex(nuIndex, QtCore.QItemSelectionModel.Select)
     elif(event.key() in [QtCore.Qt.Key_Backspace, QtCore.Qt.Key_Delete]):
       # clear current cell
-      self.tableModel.setData('', self.currentRow, self.currentCol)
-      # refresh table view
-      cellIndex = self.tableModel.index(self.currentRow, self.currentCol)
-      self.tableModel.dataChanged.emit(cellIndex, cellIndex, [QtCore.Qt.DisplayRole])
+      if(self.tableModel.setData('', self.currentRow, self.currentCol)):
+        # refresh table view
+        cellIndex = self.tableModel.index(self.currentRow, self.currentCol)
+        self.tableModel.dataChanged.emit(cellIndex, cellIndex, [QtCore.Qt.DisplayRole])
     elif (event.matches(QtGui.QKeySequence.Save) or event.matches(QtGui.QKeySequence.Open) or event.matches(QtGui.QKeySequence.HelpContents) or event.matches(QtGui.QKeySequence.Print) or event.matches(QtGui.QKeySequence.Quit)):
       # pass event to main ui
       event.ignore()
@@ -918,15 +1121,41 @@ class DataTable(QtWidgets.QTableView):
           self.menu.setStyleSheet(QSTYLESHEET)
         self.menu.popup(menuPos)    
 
-  def selectTo(self, startRow=0, endRow=0):
-    # selects target rows
+  def selectAll(self):
+    # rows are fetched lazily by model => select rows exposed so far and extend selection as more rows are fetched
+    self.allRowsSelected = (self.tableModel != None)
+    self.selectingAll = True
+    QtWidgets.QTableView.selectAll(self)
+    self.selectingAll = False
+
+  def selectionAltered(self, selected, deselected):
+    # any selection change other than select all restricts selection to rows chosen by user
+    if(not self.selectingAll):
+      self.allRowsSelected = False
+
+  def rowsInserted(self, parent, start, end):
+    QtWidgets.QTableView.rowsInserted(self, parent, start, end)
+    if(self.allRowsSelected):
+      # data comprises entire table anyhow => no need to trigger data update
+      selectionModel = self.selectionModel()
+      selectionModel.blockSignals(True)
+      self.selectTo(start, end)
+      selectionModel.blockSignals(False)
+
+  def selectTo(self, startRow=0, endRow=0, clear=False):
+    # selects target rows (replacing current selection if clear is set)
     lowRow, hiRow = min(startRow, endRow), max(startRow, endRow)
+    # ensure target rows are exposed by model
+    self.tableModel.fetchTo(hiRow)
     columnCount = self.tableModel.columnCount()
     
     topLeft = self.model().index(lowRow, 0)
     bottomRight = self.model().index(hiRow, columnCount - 1)
     itemSelection = QtCore.QItemSelection(topLeft, bottomRight)
-    self.selectionModel().select(itemSelection, QtCore.QItemSelectionModel.Select)
+    if(clear):
+      self.selectionModel().select(itemSelection, QtCore.QItemSelectionModel.ClearAndSelect)
+    else:
+      self.selectionModel().select(itemSelection, QtCore.QItemSelectionModel.Select)
 
   def pasteText(self, pastedText=''):
     # store target cell
@@ -937,33 +1166,22 @@ class DataTable(QtWidgets.QTableView):
     clipColCount = [len(i) for i in clipCols]
     # determine new data sheet dimensions
     nuRowCount, nuColCount = len(clipRows), max(clipColCount)
-    # check for trailing all-empty columns which we won't copy
-    index = nuColCount - 1
-    trailCol = nuColCount
-    while(index >= 0):
-      for entry in clipCols:
-        if(0 < index < len(entry)):
-          if(len(entry[index])):
-            trailCol = index + 1
-            index = -1
-      index -= 1
+    # check for trailing all-empty columns which we won't copy (single pass over cells, first column is never checked)
+    trailCol = max([i + 1 for row in clipCols for i, entry in enumerate(row) if ((i > 0) and len(entry))], default=nuColCount)
     # make clipped text square and truncate after trailCol
     clipCols = [i + ([''] * nuColCount) for i in clipCols]
     clipCols = [i[:trailCol] for i in clipCols]
-    # convert to number where possible
-    clipCols = [[float(j) if self.isNumber(j) else j for j in i] for i in clipCols]
+    # convert to number where possible (single parse attempt per cell)
+    if(fastnumbers != None):
+      # returns text unchanged if it is not a number
+      convertNumber = fastnumbers.fast_float
+    else:
+      convertNumber = self.convertNumber
+    clipCols = [[convertNumber(j) for j in i] for i in clipCols]
     # prepare pasting of text -- resize if needed
-    dimy, dimx = self.tableModel.rowCount(), self.tableModel.columnCount()
-    if(((offsetColumn + trailCol) > dimx) or ((offsetRow + nuRowCount) > dimy)):
-      # store current data
-      currData = self.tableModel.getAllData()
-      # blank data
-      dimx, dimy = max(dimx, offsetColumn + trailCol), max(dimy, offsetRow + nuRowCount)
-      blankData = [[''] * dimx for i in range(dimy)]
-      self.tableModel = TableModel(blankData, self)
-      self.setModel(self.tableModel)
-      # restore original data
-      self.tableModel.pasteDataBlock(data=currData, offsetRow=0, offsetColumn=0)
+    dimy, dimx = self.tableModel.totalRowCount(), self.tableModel.columnCount()
+    self.tableModel.appendColumns(offsetColumn + trailCol - dimx)
+    self.tableModel.appendRows(offsetRow + nuRowCount - dimy)
     
     # paste new data
     self.tableModel.pasteDataBlock(data=clipCols, offsetRow=offsetRow, offsetColumn=offsetColumn)
@@ -996,56 +1214,63 @@ class DataTable(QtWidgets.QTableView):
     # keeps tabs on current cell
     self.currentRow, self.currentCol = current.row(), current.column()
 
-  def isNumber(self, s):
-    # checks whether string is a number
-    try:
-      float(s)
-      return True
-    except ValueError:
-      pass
-   
-    try:
-      import unicodedata
-      unicodedata.numeric(s)
-      return True
-    except (TypeError, ValueError):
-      pass
-    
-    return False
+  def convertNumber(self, s):
+    # converts string to number where possible, otherwise returns it unchanged
+    if(NUMBER_REGEX.match(s)):
+      return float(s)
+    return s
 
 # subclass edit to better capture key presses
 class EditDataEdit(QtWidgets.QLineEdit):
   def __init__(self, parent=None):
     super(EditDataEdit, self).__init__(parent)
     self.parent = parent
+    # key handlers return True if event is fully consumed
+    self.keyHandlers = {QtCore.Qt.Key_Alt: self.keyIgnore, QtCore.Qt.Key_AltGr: self.keyIgnore,\
+      QtCore.Qt.Key_Return: self.keyEnter, QtCore.Qt.Key_Enter: self.keyEnter,\
+      QtCore.Qt.Key_Up: self.keyUp, QtCore.Qt.Key_Down: self.keyDown,\
+      QtCore.Qt.Key_Left: self.keyLeft, QtCore.Qt.Key_Right: self.keyRight}
   
   def keyPressEvent(self, event):
-    # ignore alt keys as they would close the QMenu
-    if(event.key() in [QtCore.Qt.Key_Alt, QtCore.Qt.Key_AltGr]):
+    # capture alt, enter and arrow keys
+    handler = self.keyHandlers.get(event.key())
+    if((handler != None) and handler(event)):
       return
-
-    # capture enter and arrow keys
-    if(event.key() in [QtCore.Qt.Key_Return, QtCore.Qt.Key_Enter]):
-      if(event.modifiers() & QtCore.Qt.ShiftModifier):
-        self.parent.advanceCell(-1, 0)
-      else:
-        self.parent.advanceCell(1, 0)
-    elif(event.key() == QtCore.Qt.Key_Up):
-      self.parent.advanceCell(-1, 0)
-    elif(event.key() == QtCore.Qt.Key_Down):
-      self.parent.advanceCell(1, 0)
-    elif(event.key() == QtCore.Qt.Key_Left):
-      if((event.modifiers() & QtCore.Qt.ControlModifier) or (self.cursorPosition() == 0)):
-        self.parent.advanceCell(0, -1)
-        return
-    elif(event.key() == QtCore.Qt.Key_Right):
-      if((event.modifiers() & QtCore.Qt.ControlModifier) or (self.cursorPosition() == len(self.text()))):
-        self.parent.advanceCell(0, 1)
-        return
       
     # normal event processing
     QtWidgets.QLineEdit.keyPressEvent(self, event)
 
+  def keyIgnore(self, event):
+    # ignore alt keys as they would close the QMenu
+    return True
+
+  def keyEnter(self, event):
+    if(event.modifiers() & QtCore.Qt.ShiftModifier):
+      self.parent.advanceCell(-1, 0)
+    else:
+      self.parent.advanceCell(1, 0)
+    return False
+
+  def keyUp(self, event):
+    self.parent.advanceCell(-1, 0)
+    return False
+
+  def keyDown(self, event):
+    self.parent.advanceCell(1, 0)
+    return False
+
+  def keyLeft(self, event):
+    if((event.modifiers() & QtCore.Qt.ControlModifier) or (self.cursorPosition() == 0)):
+      self.parent.advanceCell(0, -1)
+      return True
+    return False
+
+  def keyRight(self, event):
+    if((event.modifiers() & QtCore.Qt.ControlModifier) or (self.cursorPosition() == len(self.text()))):
+      self.parent.advanceCell(0, 1)
+      return True
+    return False
+
 class EditDataMenu(KuhMenu):
   def __init__(self, parent=None, tableModel=None, indexAt=None, initialEdit=''):
     super(EditDataMenu, self).__init__()
@@ -1054,10 +1279,13 @@ class EditDataMenu(KuhMenu):
     
     self.parent = parent
     self.tableModel = tableModel
-    self.maxRow, self.maxCol = self.tableModel.rowCount(), self.tableModel.columnCount()
+    self.maxRow, self.maxCol = self.tableModel.totalRowCount(), self.tableModel.columnCount()
     self.indexAt = indexAt
     self.row, self.col = self.indexAt.row(), self.indexAt.column()
     self.minWidth = scaledDPI(100)
+    # process tab keys and escape
+    self.keyHandlers = {QtCore.Qt.Key_Backtab: partial(self.advanceCell, 0, -1),\
+      QtCore.Qt.Key_Tab: partial(self.advanceCell, 0, 1), QtCore.Qt.Key_Escape: self.close}
       
     # set up GUI
     self.buildRessource()
@@ -1066,6 +1294,8 @@ class EditDataMenu(KuhMenu):
     self.adjustWindowPosition(initialEdit=initialEdit)
 
   def adjustWindowPosition(self, initialEdit=''):
+    # table dimensions may have changed in the meantime
+    self.maxRow, self.maxCol = self.tableModel.totalRowCount(), self.tableModel.columnCount()
     # update label
     labelText = 'Edit cell ' + str(self.col + 1) + '/' + str(self.row + 1)
     self.editDataLabel.setText("<html><head/><body><span style=\"font-size:130%; font-weight:bold;\">" + labelText + "</span></body></html>")
@@ -1123,20 +1353,15 @@ class EditDataMenu(KuhMenu):
         currValue = float(currValue)
       except:
         pass
-      self.parent.tableModel.setData(currValue, self.row, self.col)
-
-      # refresh table view
-      cellIndex = self.tableModel.index(self.row, self.col)
-      self.tableModel.dataChanged.emit(cellIndex, cellIndex, [QtCore.Qt.DisplayRole])
+      if(self.parent.tableModel.setData(currValue, self.row, self.col)):
+        # refresh table view
+        cellIndex = self.tableModel.index(self.row, self.col)
+        self.tableModel.dataChanged.emit(cellIndex, cellIndex, [QtCore.Qt.DisplayRole])
       
   def keyPressEvent(self, event):
-    # process tab keys and escape
-    if(event.key() == QtCore.Qt.Key_Backtab):
-      self.advanceCell(0, -1)
-    elif(event.key() == QtCore.Qt.Key_Tab):
-      self.advanceCell(0, 1)
-    elif(event.key() == QtCore.Qt.Key_Escape):
-      self.close()
+    handler = self.keyHandlers.get(event.key())
+    if(handler != None):
+      handler()
       
   def advanceCell(self, deltaRow=0, deltaCol=0):
     # update previous data
@@ -1166,8 +1391,7 @@ class EditDataMenu(KuhMenu):
 
     # set cursor in data table to currently edited cell
     self.parent.currentCol, self.parent.currentRow = self.col, self.row
-    self.parent.clearSelection()
-    self.parent.selectTo(self.row, self.row)
+    self.parent.selectTo(self.row, self.row, clear=True)
     nuIndex = self.parent.model().index(self.row, self.col)
     self.parent.selectionModel().setCurrentIndex(nuIndex, QtCore.QItemSelectionModel.Select)
 
@@ -1234,148 +1458,142 @@ class ResultsArea(QWidgetMac):
   def writeHTML(self, filename=None):
     # writes Results table to HTML file
     if(filename != None):
-      # save current figure temporarily under new filename
+      # render current figure to SVG in memory
       try:
-        self.parent.plotArea.matplot.savefig(filename, format = 'svg', dpi = 600, facecolor = self.parent.plotArea.figureColor)
+        buffer = io.StringIO()
+        self.parent.plotArea.matplot.savefig(buffer, format = 'svg', dpi = 600, facecolor = self.parent.plotArea.figureColor)
+        svg_plot = buffer.getvalue().splitlines(keepends=True)
         flag = True
       except:
-        flag = False
-      # store contents of SVG file in memory
-      if(flag):
-        readhandle = open(filename, 'r')
-        svg_plot = readhandle.readlines()
-        readhandle.close()
-      else:
         svg_plot = []
+        flag = False
       
-      # save current residuals temporarily under new filename
+      # render current residuals to SVG in memory
       try:
-        self.parent.plotArea.residplot.savefig(filename, format = 'svg', dpi = 600, facecolor = self.parent.plotArea.figureColor)
+        buffer = io.StringIO()
+        self.parent.plotArea.residplot.savefig(buffer, format = 'svg', dpi = 600, facecolor = self.parent.plotArea.figureColor)
+        svg_resid = buffer.getvalue().splitlines(keepends=True)
         flag2 = True
       except:
-        flag2 = False
-
-      # store contents of SVG file in memory
-      if(flag2):
-        readhandle = open(filename, 'r')
-        svg_resid = readhandle.readlines()
-        readhandle.close()
-      else:
         svg_resid = []
+        flag2 = False
         
-      # generate actual HTML file
-      writehandle = open(filename, 'w', encoding='utf-8')
-      
-      if(writehandle):
-        # write header
-        writehandle.write('<html xmlns="http://www.w3.org/1999/xhtml">\n<head>\n')
-        writehandle.write('<title>Fit-o-mat Results</title>\n')
-        writehandle.write('<meta charset="UTF-8">\n')
-        writehandle.write('<meta author="Moeglich laboratory, University of Bayreuth">\n')
-        writehandle.write('<meta description="Fit-o-mat Fit Results">\n')
-        writehandle.write('</head>\n<body>\n')
-        
-        writehandle.write('<h2>Fit-o-mat Results</h2>\n')
-        # check whether current fit results are available
-        if('fval' in self.descriptors):
-          fitresults = self.parent.fitarea.outstring.splitlines()
-          for index, entry in enumerate(fitresults[2:]):
-            writehandle.write(entry + '<br>\n')
-        else:
-          pass
-            
-        writehandle.write('<div class="container">\n')
-
-        # write data
-        if((self.tableModel != None) and (self.tableModel.columnCount() > 0)):
-          writehandle.write('<div class="flexmatic">\n')
-          writehandle.write('<h3>Data and Fitted Values</h3>\n')
-          writehandle.write('<table>\n<thead>\n<tr>\n')
-          for header in self.tableModel.getHeaders():
-            writehandle.write('<th>' + str(header) + '</th>\n')
-          writehandle.write('</tr>\n</thead>\n')
-          # write data table
-          writehandle.write('<tbody>\n')
-          resultsData = self.tableModel.getAllData()
-          for row in resultsData:
-            writehandle.write('<tr>\n')
-            row = [self.parent.formatNumber(i) for i in row]
-            rowstring = '</td><td>'.join(row)
-            writehandle.write('<td>' + rowstring + '</td>')
-            writehandle.write('\n</tr>\n')
-
-          writehandle.write('</tbody>\n</table>\n')
-          writehandle.write('</div>\n')
-
-        # write simulated data as well
-        simX, simY = self.parent.fit[self.parent.activeFit].x, self.parent.fit[self.parent.activeFit].y
-        writehandle.write('<div class="flexmatic">\n')
-        writehandle.write('<h3>Simulated Curve</h3>\n')
-        writehandle.write('<table>\n<thead>\n<tr>\n')
-        writehandle.write('<th>x</th>\n<th>f(x)</th>\n')
-        writehandle.write('<tbody>\n')
-        for row in range(len(simX)):
-          writehandle.write('<tr>\n')
-          writehandle.write('<td>' + self.parent.formatNumber(simX[row]) + '</td>')
-          writehandle.write('<td>' + self.parent.formatNumber(simY[row]) + '</td>')
-          writehandle.write('\n</tr>\n')
-        writehandle.write('</tbody>\n</table>\n')
-        writehandle.write('</div>\n')
-
-        # write graphics
-        writehandle.write('<div class="flexmatic2">\n')
-        writehandle.write('<h3>Plot and Residuals</h3>\n')
-        max_width = 0
-
-        # write plot figure if available
-        if(flag):
-          output = False
-          for entry in svg_plot:
-            if('<svg' in entry):
-              output = True
-              # extract width of SVG item
-              if('width' in entry):
-                red = entry.split('width')[1]
-                max_width = red.split('"')[1]
-            if(output):
-              writehandle.write(entry)
-            if('</svg' in entry):
-              output = False
-            
-        # write residuals figure if available
-        if(flag2):
-          output = False
-          for entry in svg_resid:
-            if('<svg' in entry):
-              output = True
-            if(output):
-              writehandle.write(entry)
-            if('</svg' in entry):
-              output = False
-
-        writehandle.write('</div>\n')
-        writehandle.write('</div>\n')
-        writehandle.write('<div class="disclaimer">brought to you by AM lab</div>\n')
-        # add style definitions
-        writehandle.write('</body>\n')
-        writehandle.write('<style type="text/css">\n')
-        writehandle.write('.container {\npadding: 0;\nmargin: 0;\ndisplay: flex;\nflex-direction: row;\
+      # assemble HTML document in memory
+      parts = []
+      # write header
+      parts.append('<html xmlns="http://www.w3.org/1999/xhtml">\n<head>\n')
+      parts.append('<title>Fit-o-mat Results</title>\n')
+      parts.append('<meta charset="UTF-8">\n')
+      parts.append('<meta author="Moeglich laboratory, University of Bayreuth">\n')
+      parts.append('<meta description="Fit-o-mat Fit Results">\n')
+      parts.append('</head>\n<body>\n')
+      
+      parts.append('<h2>Fit-o-mat Results</h2>\n')
+      # check whether current fit results are available
+      if('fval' in self.descriptors):
+        fitresults = self.parent.fitarea.outstring.splitlines()
+        for index, entry in enumerate(fitresults[2:]):
+          parts.append(entry + '<br>\n')
+      else:
+        pass
+          
+      parts.append('<div class="container">\n')
+
+      # write data
+      if((self.tableModel != None) and (self.tableModel.columnCount() > 0)):
+        parts.append('<div class="flexmatic">\n')
+        parts.append('<h3>Data and Fitted Values</h3>\n')
+        parts.append('<table>\n<thead>\n<tr>\n')
+        for header in self.tableModel.getHeaders():
+          parts.append('<th>' + str(header) + '</th>\n')
+        parts.append('</tr>\n</thead>\n')
+        # write data table
+        parts.append('<tbody>\n')
+        resultsData = self.formatTable(self.tableModel.getAllData())
+        rows = ['<tr>\n<td>' + '</td><td>'.join(row) + '</td>\n</tr>\n' for row in resultsData]
+        parts.extend(rows)
+
+        parts.append('</tbody>\n</table>\n')
+        parts.append('</div>\n')
+
+      # write simulated data as well
+      simX, simY = self.parent.fit[self.parent.activeFit].x, self.parent.fit[self.parent.activeFit].y
+      parts.append('<div class="flexmatic">\n')
+      parts.append('<h3>Simulated Curve</h3>\n')
+      parts.append('<table>\n<thead>\n<tr>\n')
+      parts.append('<th>x</th>\n<th>f(x)</th>\n')
+      parts.append('<tbody>\n')
+      simData = self.formatTable(np.column_stack((simX, simY)))
+      rows = ['<tr>\n<td>' + row[0] + '</td><td>' + row[1] + '</td>\n</tr>\n' for row in simData]
+      parts.extend(rows)
+      parts.append('</tbody>\n</table>\n')
+      parts.append('</div>\n')
+
+      # write graphics
+      parts.append('<div class="flexmatic2">\n')
+      parts.append('<h3>Plot and Residuals</h3>\n')
+      max_width = 0
+
+      # write plot figure if available
+      if(flag):
+        output = False
+        for entry in svg_plot:
+          if('<svg' in entry):
+            output = True
+            # extract width of SVG item
+            if('width' in entry):
+              red = entry.split('width')[1]
+              max_width = red.split('"')[1]
+          if(output):
+            parts.append(entry)
+          if('</svg' in entry):
+            output = False
+          
+      # write residuals figure if available
+      if(flag2):
+        output = False
+        for entry in svg_resid:
+          if('<svg' in entry):
+            output = True
+          if(output):
+            parts.append(entry)
+          if('</svg' in entry):
+            output = False
+
+      parts.append('</div>\n')
+      parts.append('</div>\n')
+      parts.append('<div class="disclaimer">brought to you by AM lab</div>\n')
+      # add style definitions
+      parts.append('</body>\n')
+      parts.append('<style type="text/css">\n')
+      parts.append('.container {\npadding: 0;\nmargin: 0;\ndisplay: flex;\nflex-direction: row;\
           \nalign-items: flex-start;\n}\n')
-        writehandle.write('.flexmatic {\npadding: 5px;\nmargin: 0;\nflex: 0 0 auto;\n}\n')
-        writehandle.write('.flexmatic2 {\npadding: 5px;\nmargin: 0;\nflex: 1 1 auto;\n')
-        if(max_width != 0):
-          writehandle.write('max-width: ' + max_width + ';\n')
-        writehandle.write('min-width: 200pt;\n}\n')
-        writehandle.write('svg {\nwidth: 100%;\nheight: 100%;\n}\n')
-        writehandle.write('h3 {\ntext-align: center;\n white-space: nowrap;\n}\n')
-        writehandle.write('.disclaimer {\nposition: fixed;\nbottom: 0px;\nright: 0px;\nfont-size: 125%;\
+      parts.append('.flexmatic {\npadding: 5px;\nmargin: 0;\nflex: 0 0 auto;\n}\n')
+      parts.append('.flexmatic2 {\npadding: 5px;\nmargin: 0;\nflex: 1 1 auto;\n')
+      if(max_width != 0):
+        parts.append('max-width: ' + max_width + ';\n')
+      parts.append('min-width: 200pt;\n}\n')
+      parts.append('svg {\nwidth: 100%;\nheight: 100%;\n}\n')
+      parts.append('h3 {\ntext-align: center;\n white-space: nowrap;\n}\n')
+      parts.append('.disclaimer {\nposition: fixed;\nbottom: 0px;\nright: 0px;\nfont-size: 125%;\
                                         color: #333333;\nbackground-color: rgba(255, 255, 255, 0.5);\n\
                                         border: 1px;\nborder-style: solid;\nborder-radius: 2px;\n\
                                         border-color: #333333;\npadding: 2px 10px 2px 10px;\n}\n')
-        writehandle.write('</style>\n')
-        writehandle.write('</html>\n')
-        writehandle.close()
-      
+      parts.append('</style>\n')
+      parts.append('</html>\n')
+      # write entire document at once
+      with open(filename, 'w', encoding='utf-8') as writehandle:
+        writehandle.write(''.join(parts))
+      
+  def formatTable(self, data):
+    # formats all entries of a data table for output
+    data = np.array(data, dtype=object)
+    if(data.size):
+      # cache formatted strings as tables frequently repeat values
+      formatNumber = lru_cache(maxsize=4096, typed=True)(self.parent.formatNumber)
+      return np.vectorize(formatNumber, otypes=[str])(data)
+    return data.astype(str)
+
   def writeXLS(self, filename=None):
     # writes Results table to Excel file
     if(filename != None):
@@ -1398,9 +1616,13 @@ class ResultsArea(QWidgetMac):
           worksheet.write_row(offset, 0, resultsHeader)
           # write data
           resultsData = self.tableModel.getAllData()
-          for rowIndex, row in enumerate(resultsData):
-            row = [float(self.parent.formatNumber(i)) if (j != 'labels') else i for i, j in zip(row, resultsHeader)]
-            worksheet.write_row(rowIndex + offset + 1, 0, row)
+          if(len(resultsData)):
+            # round numeric columns to displayed precision in one go
+            resultsData = np.array(resultsData, dtype=object)
+            numCols = [index for index, entry in enumerate(resultsHeader) if (entry != 'labels')]
+            resultsData[:, numCols] = self.formatTable(resultsData[:, numCols]).astype(float)
+            for rowIndex, row in enumerate(resultsData.tolist()):
+              worksheet.write_row(rowIndex + offset + 1, 0, row)
           coloffset = self.tableModel.columnCount() + 1
         else:
           coloffset = 0
@@ -1408,12 +1630,12 @@ class ResultsArea(QWidgetMac):
         simX, simY = self.parent.fit[self.parent.activeFit].x, self.parent.fit[self.parent.activeFit].y
         worksheet.write(offset, coloffset, 'x')
         worksheet.write(offset, coloffset + 1, 'f(x)')
-        for row in range(len(simX)):
-          worksheet.write(row + offset + 1, coloffset, simX[row])
-          worksheet.write(row + offset + 1, coloffset + 1, simY[row])
+        worksheet.write_column(offset + 1, coloffset, simX)
+        worksheet.write_column(offset + 1, coloffset + 1, simY)
+        row = len(simX) - 1
         # write graphics
         chart = workbook.add_chart({'type': 'scatter'})
-        worksheet.insert_chart(chr(coloffset+1+67)+str(offset+2), chart)
+        worksheet.insert_chart(xl_rowcol_to_cell(offset + 1, coloffset + 3), chart)
         # write fit
         chart.add_series({'categories': ['Sheet1', offset+1, coloffset, offset + row + 1, coloffset],\
                           'values': ['Sheet1', offset+1, coloffset + 1, offset + row + 1, coloffset + 1],\
@@ -1423,7 +1645,7 @@ class ResultsArea(QWidgetMac):
         # write data (if present)
         if(('x' in self.descriptors) and ('y' in self.descriptors)):
           xcol = self.descriptors.index('x'); ycol = self.descriptors.index('y')
-          rowcount = self.tableModel.rowCount()
+          rowcount = self.tableModel.totalRowCount()
           chartdict = {'categories': ['Sheet1', offset+1, xcol, offset + rowcount, xcol],\
                             'values': ['Sheet1', offset+1, ycol, offset + rowcount, ycol],\
                             'name': 'data',\
@@ -1431,14 +1653,14 @@ class ResultsArea(QWidgetMac):
           # include x-errors
           if('xerr' in self.descriptors):
             xerrcol = self.descriptors.index('xerr')
-            rangestring = 'Sheet1!$' + chr(xerrcol + 65) + '$' + str(offset + 2) + ':$' + chr(xerrcol + 65) + '$' + str(offset + 1 + rowcount)
+            rangestring = 'Sheet1!' + xl_range_abs(offset + 1, xerrcol, offset + rowcount, xerrcol)
             chartdict['x_error_bars'] = {'type': 'custom',\
                      'plus_values': rangestring,\
                      'minus_values': rangestring}
           # include y-errors
           if('yerr' in self.descriptors):
             yerrcol = self.descriptors.index('yerr')
-            rangestring = 'Sheet1!$' + chr(yerrcol + 65) + '$' + str(offset + 2) + ':$' + chr(yerrcol + 65) + '$' + str(offset + 1 + rowcount)
+            rangestring = 'Sheet1!' + xl_range_abs(offset + 1, yerrcol, offset + rowcount, yerrcol)
             chartdict['y_error_bars'] = {'type': 'custom',\
                      'plus_values': rangestring,\
                      'minus_values': rangestring}
@@ -1458,6 +1680,10 @@ class ResultsArea(QWidgetMac):
       self.tableModel = TableModel(values, self.resultstable)
       self.resultstable.setModel(self.tableModel)
       self.tableModel.setAllHeaders(self.descriptors)
+      # keep fixed row height for new model
+      vheader = self.resultstable.verticalHeader()
+      vheader.setDefaultSectionSize(self.rowHeight)
+      vheader.setSectionResizeMode(QtWidgets.QHeaderView.Fixed)
 
       # set col width
       self.colWidth = int(self.resultstable.size().width() / 4.5)
@@ -1472,19 +1698,43 @@ class ResultsArea(QWidgetMac):
     if event.matches(QtGui.QKeySequence.Copy):
       # prepare output
       selind = self.resultstable.selectionModel().selectedRows()
-      selind = sorted([i.row() for i in selind])      
+      selind = sorted([i.row() for i in selind])
+      if((self.tableModel != None) and (len(selind) == self.tableModel.rowCount()) and self.tableModel.canFetchMore()):
+        # entire table selected => also include rows not yet fetched by view
+        self.tableModel.fetchAll()
+        self.resultstable.selectAll()
+        selind = list(range(self.tableModel.totalRowCount()))
       # get data
       selectedData = self.tableModel.getDataRows(selind)
-      output = ''
-      for row in selectedData:
-        row = [str(i) for i in row]
-        output += '\t'.join(row) + '\n'
+      output = ''.join(['\t'.join(map(str, row)) + '\n' for row in selectedData])
       
       clipboard = QtWidgets.QApplication.clipboard()
       clipboard.setText(output)
     else:
       QtWidgets.QWidget.keyPressEvent(self, event)
 
+# signals need to be emitted by a QObject
+class DataWorkerSignals(QtCore.QObject):
+  finished = QtCore.pyqtSignal(object)
+  error = QtCore.pyqtSignal(str)
+
+# runs data processing off the GUI thread
+class DataWorker(QtCore.QRunnable):
+  def __init__(self, function, *args, **kwargs):
+    super(DataWorker, self).__init__()
+    self.function, self.args, self.kwargs = function, args, kwargs
+    self.signals = DataWorkerSignals()
+
+  def run(self):
+    try:
+      result = self.function(*self.args, **self.kwargs)
+    except Exception:
+      # pass on traceback which would otherwise be lost in worker thread
+      self.signals.error.emit(traceback.format_exc())
+      result = None
+    # delivered to GUI thread via queued connection
+    self.signals.finished.emit(result)
+
 class DataArea(QWidgetMac):
   def __init__(self, parent = None):
     super(DataArea, self).__init__()
@@ -1500,19 +1750,40 @@ class DataArea(QWidgetMac):
     self.reductionLog = 100
     self.sheetNumber = 1
     self.transposeData = False
+    # data processing runs on a single worker thread, results of superseded imports are discarded
+    self.threadPool = QtCore.QThreadPool(self)
+    self.threadPool.setMaxThreadCount(1)
+    self.dataGeneration = 0
+    self.dataWorker = None
+    self.compileWorker = None
+    # compiled transformation functions keyed by (formula, axis)
+    self.transformCache = {}
+    # guards compilation into shared namespace and cache (used from GUI and worker thread)
+    self.transformLock = threading.Lock()
+    # serializes calls into numba-compiled transforms
+    self.jitLock = threading.Lock()
 
     self.buildRessource()
     self.tableWidget.generateEmptyTable(3, 50)
-    
-    # set up namespace
+
+  @cached_property
+  def mySpace(self):
+    # set up namespace for transformations upon first use
     # import numpy again
     import numpy as np
-    # import common functions from numpy for ease of access
-    from numpy import abs, arccos, arcsin, arctan, exp, cos, cosh, log, log2, log10, power, sin, sinh, sqrt, tan, tanh
-    self.mySpace = locals()
+    # expose only numpy and its common functions for ease of access
+    names = ('abs', 'arccos', 'arcsin', 'arctan', 'exp', 'cos', 'cosh', 'log', 'log2', 'log10', 'power', 'sin', 'sinh', 'sqrt', 'tan', 'tanh')
+    namespace = {name: getattr(np, name) for name in names}
+    namespace['np'] = np
+    return namespace
 
   def buildRessource(self):
     # set up GUI
+    # precompute frequently used scaled sizes
+    sizeBase, sizeBase4, sizeDouble = scaledDPI(BASE_SIZE), scaledDPI(BASE_SIZE + 4), scaledDPI(2 * BASE_SIZE + 8)
+    size2, size40 = scaledDPI(2), scaledDPI(40)
+    # signal connections are only wired once event loop is running
+    self.pendingConnections = []
     self.validFloat = QtGui.QDoubleValidator()
     self.validInt = QtGui.QIntValidator()
     self.validInt.setBottom(1)
@@ -1529,24 +1800,24 @@ class DataArea(QWidgetMac):
     
     self.importButton = QPushButtonMac()
     self.importButton.setText('Open File')
-    self.importButton.clicked.connect(self.loadData)
-    self.importButton.setMaximumSize(scaledDPI(100), scaledDPI(BASE_SIZE))
-    self.importButton.setMinimumSize(scaledDPI(100), scaledDPI(BASE_SIZE))
+    self.pendingConnections.append((self.importButton.clicked, self.loadData))
+    self.importButton.setMaximumSize(scaledDPI(100), sizeBase)
+    self.importButton.setMinimumSize(scaledDPI(100), sizeBase)
     self.importLayout.addWidget(self.importButton)
 
     self.killCommaButton = QPushButtonMac()
     self.killCommaButton.setText('Replace Comma')
-    self.killCommaButton.clicked.connect(self.killTheComma)
-    self.killCommaButton.setMaximumSize(scaledDPI(100), scaledDPI(BASE_SIZE))
-    self.killCommaButton.setMinimumSize(scaledDPI(100), scaledDPI(BASE_SIZE))
+    self.pendingConnections.append((self.killCommaButton.clicked, self.killTheComma))
+    self.killCommaButton.setMaximumSize(scaledDPI(100), sizeBase)
+    self.killCommaButton.setMinimumSize(scaledDPI(100), sizeBase)
     self.importLayout.addWidget(self.killCommaButton)
 
     self.transposeCheck = QtWidgets.QCheckBox()
     self.transposeCheck = QtWidgets.QCheckBox(self.importBox)
-    self.transposeCheck.setGeometry(QtCore.QRect(scaledDPI(2), scaledDPI(2), scaledDPI(40), scaledDPI(BASE_SIZE)))
+    self.transposeCheck.setGeometry(QtCore.QRect(size2, size2, size40, sizeBase))
     self.transposeCheck.setChecked(False)
     self.transposeCheck.setText('transpose?')
-    self.transposeCheck.stateChanged.connect(self.dataTransposition)
+    self.pendingConnections.append((self.transposeCheck.stateChanged, self.dataTransposition))
     self.importLayout.addWidget(self.transposeCheck)
     
     self.sheetBox = QWidgetMac()
@@ -1556,8 +1827,8 @@ class DataArea(QWidgetMac):
     self.sheetLayout.setAlignment(QtCore.Qt.AlignLeft)
 
     self.importSheetLabel = QtWidgets.QLabel('sheet')
-    self.importSheetLabel.setMaximumSize(scaledDPI(28), scaledDPI(BASE_SIZE))
-    self.importSheetLabel.setMinimumSize(scaledDPI(28), scaledDPI(BASE_SIZE))
+    self.importSheetLabel.setMaximumSize(scaledDPI(28), sizeBase)
+    self.importSheetLabel.setMinimumSize(scaledDPI(28), sizeBase)
     self.sheetLayout.addWidget(self.importSheetLabel)
     self.importSheetLabel.setEnabled(False)
     
@@ -1565,9 +1836,9 @@ class DataArea(QWidgetMac):
     self.importSheetSpinBox.setMinimum(1)
     self.importSheetSpinBox.setMaximum(self.sheetNumber)
     self.importSheetSpinBox.setValue(1)
-    self.importSheetSpinBox.setMinimumSize(scaledDPI(50), scaledDPI(BASE_SIZE))
-    self.importSheetSpinBox.setMaximumSize(scaledDPI(50), scaledDPI(BASE_SIZE))
-    self.importSheetSpinBox.valueChanged.connect(self.changeSheet)
+    self.importSheetSpinBox.setMinimumSize(scaledDPI(50), sizeBase)
+    self.importSheetSpinBox.setMaximumSize(scaledDPI(50), sizeBase)
+    self.pendingConnections.append((self.importSheetSpinBox.valueChanged, self.changeSheet))
     self.importSheetSpinBox.setEnabled(False)
     self.sheetLayout.addWidget(self.importSheetSpinBox)
     
@@ -1578,7 +1849,8 @@ class DataArea(QWidgetMac):
     self.tableWidget = DataTable(self)
     self.vLayout.addWidget(self.tableWidget)
     
-    # set up box for error specification
+    # set up boxes for error specification, data reduction and transform
+    # (their contents are only built once main window is up)
     blah = self.HLine()
     self.vLayout.addWidget(blah)
     
@@ -1587,44 +1859,119 @@ class DataArea(QWidgetMac):
     self.vLayout.addWidget(self.errorSelectorBox)
     self.errorSelectorLayout = QtWidgets.QHBoxLayout(self.errorSelectorBox)
     self.errorSelectorLayout.setContentsMargins(0, 0, 0, 0)
+    self.dataReductionBox = QWidgetMac()
+    self.dataReductionBox.setContentsMargins(0, 0, 0, 0)
+    self.vLayout.addWidget(self.dataReductionBox)
+    self.dataReductionLayout = QtWidgets.QHBoxLayout(self.dataReductionBox)
+    self.dataReductionLayout.setContentsMargins(0, 0, 0, 0)
+    self.dataTransformBox = QWidgetMac()
+    self.dataTransformBox.setContentsMargins(0, 0, 0, 0)
+    self.vLayout.addWidget(self.dataTransformBox)
+    self.dataTransformLayout = QtWidgets.QHBoxLayout(self.dataTransformBox)
+    self.dataTransformLayout.setContentsMargins(0, 0, 0, 0)
+    for entry in [self.errorSelectorBox, self.dataReductionBox, self.dataTransformBox]:
+      entry.setMinimumHeight(sizeDouble)
+    self.deferredUIBuilt = False
+    # data sets awaiting plot update after import
+    self.refreshPending, self.refreshRedraw, self.refreshResults, self.refreshScheduled = [], False, None, False
+    QtCore.QTimer.singleShot(500, self.buildDeferredUI)
+
+    # set up data import controls
+    blah = self.HLine()
+    self.vLayout.addWidget(blah)
     
+    self.refreshBox = QWidgetMac()
+    self.refreshBox.setContentsMargins(0, 0, 0, 0)
+    self.vLayout.addWidget(self.refreshBox)
+    self.refreshLayout = QtWidgets.QHBoxLayout(self.refreshBox)
+    self.refreshLayout.setContentsMargins(0, 0, 0, 0)
+    self.refreshButton = QPushButtonMac()
+    self.refreshButton.setText('Import Data')
+    self.refreshButton.setMaximumHeight(sizeBase)
+    self.refreshButton.setMinimumHeight(sizeBase)
+    self.pendingConnections.append((self.refreshButton.clicked, partial(self.updateData, False, True, False)))
+    self.refreshLayout.addWidget(self.refreshButton)
+
+    self.dataSeriesButton = QPushButtonMac()
+    self.dataSeriesButton.setText('Import Data Series')
+    self.dataSeriesButton.setMaximumHeight(sizeBase)
+    self.dataSeriesButton.setMinimumHeight(sizeBase)
+    self.pendingConnections.append((self.dataSeriesButton.clicked, self.importDataSeries))
+    self.refreshLayout.addWidget(self.dataSeriesButton)
+    
+    self.refreshCheck = QtWidgets.QCheckBox()
+    self.refreshCheck.setText('Auto Import?')
+    self.refreshCheck.setChecked(False)
+    self.pendingConnections.append((self.refreshCheck.stateChanged, partial(self.updateData, True, True, False)))
+    #self.refreshLayout.addWidget(self.refreshCheck)
+    QtCore.QTimer.singleShot(0, self.wireConnections)
+
+  def wireConnections(self):
+    # establishes signal connections deferred during setup
+    for signal, slot in self.pendingConnections:
+      signal.connect(slot)
+    self.pendingConnections = []
+
+  def buildDeferredUI(self):
+    # sets up controls for error model, data reduction and transform
+    if(self.deferredUIBuilt):
+      return
+    self.deferredUIBuilt = True
+    sizeBase, sizeBase4, sizeDouble = scaledDPI(BASE_SIZE), scaledDPI(BASE_SIZE + 4), scaledDPI(2 * BASE_SIZE + 8)
+    size2, size40 = scaledDPI(2), scaledDPI(40)
+
+    def setupGroupLayout(group):
+      # grid layout packing fixed-size controls into two rows at upper left
+      layout = QtWidgets.QGridLayout(group)
+      layout.setContentsMargins(size2, size2, size2, 0)
+      layout.setHorizontalSpacing(scaledDPI(4))
+      layout.setVerticalSpacing(size2)
+      layout.setColumnStretch(8, 1)
+      layout.setRowStretch(2, 1)
+      return layout
+
+    def placeWidget(layout, widget, row, column, width, columnSpan=1):
+      # adds fixed-size widget to group layout
+      widget.setMinimumSize(width, sizeBase)
+      widget.setMaximumSize(width, sizeBase)
+      layout.addWidget(widget, row, column, 1, columnSpan)
+
+    # set up box for error specification
     self.errorSelectorLabel = QtWidgets.QLabel('error')
-    self.errorSelectorLabel.setMaximumSize(scaledDPI(32), scaledDPI(BASE_SIZE))
-    self.errorSelectorLabel.setMinimumSize(scaledDPI(32), scaledDPI(BASE_SIZE))
+    self.errorSelectorLabel.setMaximumSize(scaledDPI(32), sizeBase)
+    self.errorSelectorLabel.setMinimumSize(scaledDPI(32), sizeBase)
     self.errorSelectorLayout.addWidget(self.errorSelectorLabel)
     
     self.errorSelectorGroup = QtWidgets.QGroupBox()
-    self.errorSelectorGroup.setMinimumHeight(scaledDPI(2 * BASE_SIZE + 8))
-    self.errorSelectorGroup.setMaximumHeight(scaledDPI(2 * BASE_SIZE + 8))
+    self.errorSelectorGroup.setMinimumHeight(sizeDouble)
+    self.errorSelectorGroup.setMaximumHeight(sizeDouble)
     self.errorSelectorLayout.addWidget(self.errorSelectorGroup)
 
-    self.errorGroupLayout = QtWidgets.QHBoxLayout()
-    self.errorSelectorGroup.setLayout(self.errorGroupLayout)
+    self.errorGroupLayout = setupGroupLayout(self.errorSelectorGroup)
     
     self.errorSelectorButtons = []
+    # button ids correspond to error models
+    self.errorButtonGroup = QtWidgets.QButtonGroup(self)
+    self.errorButtonGroup.buttonToggled.connect(self.toggleErrorModel)
     self.errorSelectorButtons.append(QtWidgets.QRadioButton(self.errorSelectorGroup))
-    self.errorSelectorButtons[-1].setGeometry(QtCore.QRect(scaledDPI(2), scaledDPI(2),\
-      scaledDPI(44), scaledDPI(BASE_SIZE)))
+    placeWidget(self.errorGroupLayout, self.errorSelectorButtons[-1], 0, 0, scaledDPI(44))
     self.errorSelectorButtons[-1].setChecked(False)
-    self.errorSelectorButtons[-1].toggled.connect(partial(self.toggleErrorModel, 3))
+    self.errorButtonGroup.addButton(self.errorSelectorButtons[-1], 3)
     self.errorSelectorButtons[-1].setText('none')
     
     self.errorSelectorButtons.append(QtWidgets.QRadioButton(self.errorSelectorGroup))
-    self.errorSelectorButtons[-1].setGeometry(QtCore.QRect(scaledDPI(286), scaledDPI(2),\
-      scaledDPI(32), scaledDPI(BASE_SIZE)))
+    placeWidget(self.errorGroupLayout, self.errorSelectorButtons[-1], 0, 7, scaledDPI(32))
     self.errorSelectorButtons[-1].setChecked(True)
-    self.errorSelectorButtons[-1].toggled.connect(partial(self.toggleErrorModel, 0))
+    self.errorButtonGroup.addButton(self.errorSelectorButtons[-1], 0)
     self.errorSelectorButtons[-1].setText(u'\N{GREEK CAPITAL LETTER DELTA}y')
     
     self.errorSelectorButtons.append(QtWidgets.QRadioButton(self.errorSelectorGroup))
-    self.errorSelectorButtons[-1].setGeometry(QtCore.QRect(scaledDPI(52),\
-      scaledDPI(2), scaledDPI(44), scaledDPI(BASE_SIZE)))
+    placeWidget(self.errorGroupLayout, self.errorSelectorButtons[-1], 0, 1, scaledDPI(44))
     self.errorSelectorButtons[-1].setChecked(False)
-    self.errorSelectorButtons[-1].toggled.connect(partial(self.toggleErrorModel, 1))
+    self.errorButtonGroup.addButton(self.errorSelectorButtons[-1], 1)
     self.errorSelectorButtons[-1].setText('const')
     self.errorConstEntry = QLineEditClick(self.errorSelectorGroup)
-    self.errorConstEntry.setGeometry(QtCore.QRect(scaledDPI(106),\
-      scaledDPI(2), scaledDPI(40), scaledDPI(BASE_SIZE)))
+    placeWidget(self.errorGroupLayout, self.errorConstEntry, 0, 2, size40)
     self.errorConstEntry.setText(str(self.errorConst))
     self.errorConstEntry.setValidator(self.validFloat)
     self.errorConstEntry.editingFinished.connect(partial(self.validateErrorEntry, self.errorConstEntry, 'errorConst'))
@@ -1632,65 +1979,57 @@ class DataArea(QWidgetMac):
     self.errorConstEntry.focusInEvent = partial(self.gainFocus, self.errorSelectorButtons[-1], self.errorConstEntry.focusInEvent)
     
     self.errorSelectorButtons.append(QtWidgets.QRadioButton(self.errorSelectorGroup))
-    self.errorSelectorButtons[-1].setGeometry(QtCore.QRect(scaledDPI(172),\
-      scaledDPI(2), scaledDPI(42), scaledDPI(BASE_SIZE)))
+    placeWidget(self.errorGroupLayout, self.errorSelectorButtons[-1], 0, 4, scaledDPI(42))
     self.errorSelectorButtons[-1].setChecked(False)
-    self.errorSelectorButtons[-1].toggled.connect(partial(self.toggleErrorModel, 2))
+    self.errorButtonGroup.addButton(self.errorSelectorButtons[-1], 2)
     self.errorSelectorButtons[-1].setText('prop')
     self.errorPercentEntry = QLineEditClick(self.errorSelectorGroup)
-    self.errorPercentEntry.setGeometry(QtCore.QRect(scaledDPI(218),\
-      scaledDPI(2), scaledDPI(40), scaledDPI(BASE_SIZE)))
+    placeWidget(self.errorGroupLayout, self.errorPercentEntry, 0, 5, size40)
     self.errorPercentEntry.setText(str(self.errorPercent))
     self.errorPercentEntry.editingFinished.connect(partial(self.validateErrorEntry, self.errorPercentEntry, 'errorPercent'))
     self.errorPercentEntry.focusOutEvent = partial(self.lostFocus, self.errorPercentEntry, 'errorPercent', self.errorPercentEntry.focusOutEvent)
     self.errorPercentEntry.focusInEvent = partial(self.gainFocus, self.errorSelectorButtons[-1], self.errorPercentEntry.focusInEvent)
     self.errorPercentEntry.setValidator(self.validFloat)
     self.errorPercentLabel = QtWidgets.QLabel(self.errorSelectorGroup)
-    self.errorPercentLabel.setGeometry(QtCore.QRect(scaledDPI(262),\
-      scaledDPI(2), scaledDPI(18), scaledDPI(BASE_SIZE)))
+    placeWidget(self.errorGroupLayout, self.errorPercentLabel, 0, 6, scaledDPI(18))
     self.errorPercentLabel.setText('%')
     
     self.errorPropagateCheck = QtWidgets.QCheckBox(self.errorSelectorGroup)
-    self.errorPropagateCheck.setGeometry(QtCore.QRect(scaledDPI(2), scaledDPI(BASE_SIZE + 4), scaledDPI(80), scaledDPI(BASE_SIZE)))
+    placeWidget(self.errorGroupLayout, self.errorPropagateCheck, 1, 0, scaledDPI(80), columnSpan=2)
     self.errorPropagateCheck.setChecked(self.errorPropagate)
     self.errorPropagateCheck.setText('propagate?')
     self.errorPropagateCheck.toggled.connect(self.toggleErrorPropagation)
 
     # set up box for data reduction
-    self.dataReductionBox = QWidgetMac()
-    self.dataReductionBox.setContentsMargins(0, 0, 0, 0)
-    self.vLayout.addWidget(self.dataReductionBox)
-    self.dataReductionLayout = QtWidgets.QHBoxLayout(self.dataReductionBox)
-    self.dataReductionLayout.setContentsMargins(0, 0, 0, 0)
-    
     self.dataReductionLabel = QtWidgets.QLabel('reduce')
-    self.dataReductionLabel.setMaximumSize(scaledDPI(32), scaledDPI(BASE_SIZE))
-    self.dataReductionLabel.setMinimumSize(scaledDPI(32), scaledDPI(BASE_SIZE))
+    self.dataReductionLabel.setMaximumSize(scaledDPI(32), sizeBase)
+    self.dataReductionLabel.setMinimumSize(scaledDPI(32), sizeBase)
     self.dataReductionLayout.addWidget(self.dataReductionLabel)
     
     self.dataReductionGroup = QtWidgets.QGroupBox()
-    self.dataReductionGroup.setMinimumHeight(scaledDPI(2 * BASE_SIZE + 8))
-    self.dataReductionGroup.setMaximumHeight(scaledDPI(2 * BASE_SIZE + 8))
+    self.dataReductionGroup.setMinimumHeight(sizeDouble)
+    self.dataReductionGroup.setMaximumHeight(sizeDouble)
     self.dataReductionLayout.addWidget(self.dataReductionGroup)
+    self.dataReductionGroupLayout = setupGroupLayout(self.dataReductionGroup)
     
     self.dataReductionButtons = []
+    # button ids correspond to data reduction models
+    self.dataReductionButtonGroup = QtWidgets.QButtonGroup(self)
+    self.dataReductionButtonGroup.buttonToggled.connect(self.toggleDataReduction)
     self.dataReductionButtons.append(QtWidgets.QRadioButton(self.dataReductionGroup))
-    self.dataReductionButtons[-1].setGeometry(QtCore.QRect(scaledDPI(2), scaledDPI(2),\
-      scaledDPI(44), scaledDPI(BASE_SIZE)))
+    placeWidget(self.dataReductionGroupLayout, self.dataReductionButtons[-1], 0, 0, scaledDPI(44))
     self.dataReductionButtons[-1].setChecked(True)
-    self.dataReductionButtons[-1].toggled.connect(partial(self.toggleDataReduction, 0))
+    self.dataReductionButtonGroup.addButton(self.dataReductionButtons[-1], 0)
     self.dataReductionButtons[-1].setText('none')
     
     self.dataReductionButtons.append(QtWidgets.QRadioButton(self.dataReductionGroup))
-    self.dataReductionButtons[-1].setGeometry(QtCore.QRect(scaledDPI(52), scaledDPI(2),\
-      scaledDPI(40), scaledDPI(BASE_SIZE)))
+    placeWidget(self.dataReductionGroupLayout, self.dataReductionButtons[-1], 0, 1, size40)
     self.dataReductionButtons[-1].setChecked(False)
-    self.dataReductionButtons[-1].toggled.connect(partial(self.toggleDataReduction, 1))
+    self.dataReductionButtonGroup.addButton(self.dataReductionButtons[-1], 1)
     self.dataReductionButtons[-1].setText('skip')
 
     self.dataSkipEntry = QLineEditClick(self.dataReductionGroup)
-    self.dataSkipEntry.setGeometry(QtCore.QRect(scaledDPI(106),\
-      scaledDPI(2), scaledDPI(40), scaledDPI(BASE_SIZE)))
+    placeWidget(self.dataReductionGroupLayout, self.dataSkipEntry, 0, 2, size40)
     self.dataSkipEntry.setText(str(self.reductionSkip))
     self.dataSkipEntry.editingFinished.connect(partial(self.validateReductionEntry, self.dataSkipEntry, 'reductionSkip'))
     self.dataSkipEntry.focusOutEvent = partial(self.lostFocusInt, self.dataSkipEntry, 'reductionSkip', self.dataSkipEntry.focusOutEvent)
@@ -1698,20 +2037,17 @@ class DataArea(QWidgetMac):
     self.dataSkipEntry.setValidator(self.validInt)
     
     self.dataSkipLabel = QtWidgets.QLabel(self.dataReductionGroup)
-    self.dataSkipLabel.setGeometry(QtCore.QRect(scaledDPI(150),\
-      scaledDPI(2), scaledDPI(15), scaledDPI(BASE_SIZE)))
+    placeWidget(self.dataReductionGroupLayout, self.dataSkipLabel, 0, 3, scaledDPI(15))
     self.dataSkipLabel.setText('pts')
 
     self.dataReductionButtons.append(QtWidgets.QRadioButton(self.dataReductionGroup))
-    self.dataReductionButtons[-1].setGeometry(QtCore.QRect(scaledDPI(172), scaledDPI(2),\
-      scaledDPI(36), scaledDPI(BASE_SIZE)))
+    placeWidget(self.dataReductionGroupLayout, self.dataReductionButtons[-1], 0, 4, scaledDPI(36))
     self.dataReductionButtons[-1].setChecked(False)
-    self.dataReductionButtons[-1].toggled.connect(partial(self.toggleDataReduction, 2))
+    self.dataReductionButtonGroup.addButton(self.dataReductionButtons[-1], 2)
     self.dataReductionButtons[-1].setText('avg')
 
     self.dataAvgEntry = QLineEditClick(self.dataReductionGroup)
-    self.dataAvgEntry.setGeometry(QtCore.QRect(scaledDPI(218),\
-      scaledDPI(2), scaledDPI(40), scaledDPI(BASE_SIZE)))
+    placeWidget(self.dataReductionGroupLayout, self.dataAvgEntry, 0, 5, size40)
     self.dataAvgEntry.setText(str(self.reductionAvg))
     self.dataAvgEntry.editingFinished.connect(partial(self.validateReductionEntry, self.dataAvgEntry, 'reductionAvg'))
     self.dataAvgEntry.focusOutEvent = partial(self.lostFocusInt, self.dataAvgEntry, 'reductionAvg', self.dataAvgEntry.focusOutEvent)
@@ -1719,20 +2055,17 @@ class DataArea(QWidgetMac):
     self.dataAvgEntry.setValidator(self.validInt)
     
     self.dataAvgLabel = QtWidgets.QLabel(self.dataReductionGroup)
-    self.dataAvgLabel.setGeometry(QtCore.QRect(scaledDPI(262),\
-      scaledDPI(2), scaledDPI(15), scaledDPI(BASE_SIZE)))
+    placeWidget(self.dataReductionGroupLayout, self.dataAvgLabel, 0, 6, scaledDPI(15))
     self.dataAvgLabel.setText('pts')
 
     self.dataReductionButtons.append(QtWidgets.QRadioButton(self.dataReductionGroup))
-    self.dataReductionButtons[-1].setGeometry(QtCore.QRect(scaledDPI(52), scaledDPI(BASE_SIZE + 4),\
-      scaledDPI(50), scaledDPI(BASE_SIZE)))
+    placeWidget(self.dataReductionGroupLayout, self.dataReductionButtons[-1], 1, 1, scaledDPI(50))
     self.dataReductionButtons[-1].setChecked(False)
-    self.dataReductionButtons[-1].toggled.connect(partial(self.toggleDataReduction, 3))
+    self.dataReductionButtonGroup.addButton(self.dataReductionButtons[-1], 3)
     self.dataReductionButtons[-1].setText('mvavg')
 
     self.dataMovAvgEntry = QLineEditClick(self.dataReductionGroup)
-    self.dataMovAvgEntry.setGeometry(QtCore.QRect(scaledDPI(106),\
-      scaledDPI(BASE_SIZE + 4), scaledDPI(40), scaledDPI(BASE_SIZE)))
+    placeWidget(self.dataReductionGroupLayout, self.dataMovAvgEntry, 1, 2, size40)
     self.dataMovAvgEntry.setText(str(self.reductionMovAvg))
     self.dataMovAvgEntry.editingFinished.connect(partial(self.validateReductionEntry, self.dataMovAvgEntry, 'reductionMovAvg'))
     self.dataMovAvgEntry.focusOutEvent = partial(self.lostFocusInt, self.dataMovAvgEntry, 'reductionMovAvg', self.dataMovAvgEntry.focusOutEvent)
@@ -1740,20 +2073,17 @@ class DataArea(QWidgetMac):
     self.dataMovAvgEntry.setValidator(self.validInt)
     
     self.dataMovAvgLabel = QtWidgets.QLabel(self.dataReductionGroup)
-    self.dataMovAvgLabel.setGeometry(QtCore.QRect(scaledDPI(150),\
-      scaledDPI(BASE_SIZE + 4), scaledDPI(15), scaledDPI(BASE_SIZE)))
+    placeWidget(self.dataReductionGroupLayout, self.dataMovAvgLabel, 1, 3, scaledDPI(15))
     self.dataMovAvgLabel.setText('pts')
 
     self.dataReductionButtons.append(QtWidgets.QRadioButton(self.dataReductionGroup))
-    self.dataReductionButtons[-1].setGeometry(QtCore.QRect(scaledDPI(172), scaledDPI(BASE_SIZE + 4),\
-      scaledDPI(36), scaledDPI(BASE_SIZE)))
+    placeWidget(self.dataReductionGroupLayout, self.dataReductionButtons[-1], 1, 4, scaledDPI(36))
     self.dataReductionButtons[-1].setChecked(False)
-    self.dataReductionButtons[-1].toggled.connect(partial(self.toggleDataReduction, 4))
+    self.dataReductionButtonGroup.addButton(self.dataReductionButtons[-1], 4)
     self.dataReductionButtons[-1].setText('log')
 
     self.dataLogEntry = QLineEditClick(self.dataReductionGroup)
-    self.dataLogEntry.setGeometry(QtCore.QRect(scaledDPI(218),\
-      scaledDPI(BASE_SIZE + 4), scaledDPI(40), scaledDPI(BASE_SIZE)))
+    placeWidget(self.dataReductionGroupLayout, self.dataLogEntry, 1, 5, size40)
     self.dataLogEntry.setText(str(self.reductionLog))
     self.dataLogEntry.editingFinished.connect(partial(self.validateReductionEntry, self.dataLogEntry, 'reductionLog'))
     self.dataLogEntry.focusOutEvent = partial(self.lostFocusInt, self.dataLogEntry, 'reductionLog', self.dataLogEntry.focusOutEvent)
@@ -1761,79 +2091,42 @@ class DataArea(QWidgetMac):
     self.dataLogEntry.setValidator(self.validInt)
 
     self.dataLogLabel = QtWidgets.QLabel(self.dataReductionGroup)
-    self.dataLogLabel.setGeometry(QtCore.QRect(scaledDPI(262),\
-      scaledDPI(BASE_SIZE + 4), scaledDPI(40), scaledDPI(BASE_SIZE)))
+    placeWidget(self.dataReductionGroupLayout, self.dataLogLabel, 1, 6, size40)
     self.dataLogLabel.setText('pts (ca.)')
 
     # set up box for data transform
-    self.dataTransformBox = QWidgetMac()
-    self.dataTransformBox.setContentsMargins(0, 0, 0, 0)
-    self.vLayout.addWidget(self.dataTransformBox)
-    self.dataTransformLayout = QtWidgets.QHBoxLayout(self.dataTransformBox)
-    self.dataTransformLayout.setContentsMargins(0, 0, 0, 0)
-    
     self.dataTransformLabel = QtWidgets.QLabel('transf.')
-    self.dataTransformLabel.setMaximumSize(scaledDPI(32), scaledDPI(BASE_SIZE))
-    self.dataTransformLabel.setMinimumSize(scaledDPI(32), scaledDPI(BASE_SIZE))
+    self.dataTransformLabel.setMaximumSize(scaledDPI(32), sizeBase)
+    self.dataTransformLabel.setMinimumSize(scaledDPI(32), sizeBase)
     self.dataTransformLayout.addWidget(self.dataTransformLabel)
 
     self.dataTransformGroup = QtWidgets.QGroupBox()
-    self.dataTransformGroup.setMinimumHeight(scaledDPI(2 * BASE_SIZE + 8))
-    self.dataTransformGroup.setMaximumHeight(scaledDPI(2 * BASE_SIZE + 8))
+    self.dataTransformGroup.setMinimumHeight(sizeDouble)
+    self.dataTransformGroup.setMaximumHeight(sizeDouble)
     self.dataTransformLayout.addWidget(self.dataTransformGroup)
+    self.dataTransformGroupLayout = setupGroupLayout(self.dataTransformGroup)
 
     self.dataTransformXCheck = QtWidgets.QCheckBox(self.dataTransformGroup)
-    self.dataTransformXCheck.setGeometry(QtCore.QRect(scaledDPI(2),\
-      scaledDPI(2), scaledDPI(40), scaledDPI(BASE_SIZE)))
+    placeWidget(self.dataTransformGroupLayout, self.dataTransformXCheck, 0, 0, size40)
     self.dataTransformXCheck.setChecked(False)
     self.dataTransformXCheck.setText('x =')
 
     self.dataTransformXEntry = QLineEditClick(self.dataTransformGroup)
-    self.dataTransformXEntry.setGeometry(QtCore.QRect(scaledDPI(44),\
-      scaledDPI(2), scaledDPI(200), scaledDPI(BASE_SIZE)))
+    placeWidget(self.dataTransformGroupLayout, self.dataTransformXEntry, 0, 1, scaledDPI(200))
     self.dataTransformXEntry.setText('x')
     self.dataTransformXEntry.textChanged.connect(partial(self.dataTransformXCheck.setChecked, True))
+    self.dataTransformXEntry.editingFinished.connect(partial(self.precompileTransform, 'x', self.dataTransformXEntry))
 
     self.dataTransformYCheck = QtWidgets.QCheckBox(self.dataTransformGroup)
-    self.dataTransformYCheck.setGeometry(QtCore.QRect(scaledDPI(2),\
-      scaledDPI(BASE_SIZE + 4), scaledDPI(40), scaledDPI(BASE_SIZE)))
+    placeWidget(self.dataTransformGroupLayout, self.dataTransformYCheck, 1, 0, size40)
     self.dataTransformYCheck.setChecked(False)
     self.dataTransformYCheck.setText('y =')
 
     self.dataTransformYEntry = QLineEditClick(self.dataTransformGroup)
-    self.dataTransformYEntry.setGeometry(QtCore.QRect(scaledDPI(44),\
-      scaledDPI(BASE_SIZE + 4), scaledDPI(200), scaledDPI(BASE_SIZE)))
+    placeWidget(self.dataTransformGroupLayout, self.dataTransformYEntry, 1, 1, scaledDPI(200))
     self.dataTransformYEntry.setText('y')
     self.dataTransformYEntry.textChanged.connect(partial(self.dataTransformYCheck.setChecked, True))
-
-    # set up data import controls
-    blah = self.HLine()
-    self.vLayout.addWidget(blah)
-    
-    self.refreshBox = QWidgetMac()
-    self.refreshBox.setContentsMargins(0, 0, 0, 0)
-    self.vLayout.addWidget(self.refreshBox)
-    self.refreshLayout = QtWidgets.QHBoxLayout(self.refreshBox)
-    self.refreshLayout.setContentsMargins(0, 0, 0, 0)
-    self.refreshButton = QPushButtonMac()
-    self.refreshButton.setText('Import Data')
-    self.refreshButton.setMaximumHeight(scaledDPI(BASE_SIZE))
-    self.refreshButton.setMinimumHeight(scaledDPI(BASE_SIZE))
-    self.refreshButton.clicked.connect(partial(self.updateData, False, True, False))
-    self.refreshLayout.addWidget(self.refreshButton)
-
-    self.dataSeriesButton = QPushButtonMac()
-    self.dataSeriesButton.setText('Import Data Series')
-    self.dataSeriesButton.setMaximumHeight(scaledDPI(BASE_SIZE))
-    self.dataSeriesButton.setMinimumHeight(scaledDPI(BASE_SIZE))
-    self.dataSeriesButton.clicked.connect(self.importDataSeries)
-    self.refreshLayout.addWidget(self.dataSeriesButton)
-    
-    self.refreshCheck = QtWidgets.QCheckBox()
-    self.refreshCheck.setText('Auto Import?')
-    self.refreshCheck.setChecked(False)
-    self.refreshCheck.stateChanged.connect(partial(self.updateData, True, True, False))
-    #self.refreshLayout.addWidget(self.refreshCheck)
+    self.dataTransformYEntry.editingFinished.connect(partial(self.precompileTransform, 'y', self.dataTransformYEntry))
 
   def reportState(self):
     # reports data content for saveState function
@@ -1895,13 +2188,15 @@ class DataArea(QWidgetMac):
     if(defaultHandler != None):
       defaultHandler(event)
 
-  def toggleDataReduction(self, mode=0):
-    # change error model
-    self.reductionModel = mode
+  def toggleDataReduction(self, button=None, checked=True):
+    # change data reduction model
+    if(checked):
+      self.reductionModel = self.dataReductionButtonGroup.id(button)
 
-  def toggleErrorModel(self, mode=0):
+  def toggleErrorModel(self, button=None, checked=True):
     # change error model
-    self.errorModel = mode
+    if(checked):
+      self.errorModel = self.errorButtonGroup.id(button)
 
   def toggleErrorPropagation(self):
     # toggles error propagation
@@ -1912,10 +2207,10 @@ class DataArea(QWidgetMac):
     if(entryobject != None):
       entrytext = entryobject.text()
       if(self.parent.isNumber(entrytext)):
-        self.__dict__[quantity] = int(entrytext)
+        setattr(self, quantity, int(entrytext))
       else:
         # restore previous value
-        entryobject.setText(str(self.__dict__[quantity]))
+        entryobject.setText(str(getattr(self, quantity)))
     # pass signal to original handler
     if(defaultHandler != None):
       defaultHandler(event)
@@ -1926,20 +2221,20 @@ class DataArea(QWidgetMac):
       entrytext = entryobject.text()
       if(self.parent.isNumber(entrytext)):
         newnumber = int(entrytext)
-        self.__dict__[quantity] = np.abs(newnumber)
+        setattr(self, quantity, abs(newnumber))
       else:
         # restore previous value
-        entryobject.setText(str(self.__dict__[quantity]))
+        entryobject.setText(str(getattr(self, quantity)))
 
   def lostFocus(self, entryobject=None, quantity=None, defaultHandler=None, event=None):
     # entry field lost focus, perform sanity check
     if(entryobject != None):
       entrytext = entryobject.text()
       if(self.parent.isNumber(entrytext)):
-        self.__dict__[quantity] = float(entrytext)
+        setattr(self, quantity, float(entrytext))
       else:
         # restore previous value
-        entryobject.setText(str(self.__dict__[quantity]))
+        entryobject.setText(str(getattr(self, quantity)))
     # pass signal to original handler
     if(defaultHandler != None):
       defaultHandler(event)
@@ -1950,12 +2245,12 @@ class DataArea(QWidgetMac):
       entrytext = entryobject.text()
       if(self.parent.isNumber(entrytext)):
         newnumber = float(entrytext)
-        self.__dict__[quantity] = np.abs(newnumber)
+        setattr(self, quantity, abs(newnumber))
         if(newnumber < 0):
-          entryobject.setText(str(np.abs(newnumber)))
+          entryobject.setText(str(abs(newnumber)))
       else:
         # restore previous value
-        entryobject.setText(str(self.__dict__[quantity]))
+        entryobject.setText(str(getattr(self, quantity)))
 
   def HLine(self):
     # draws a horizontal line
@@ -1966,8 +2261,6 @@ class DataArea(QWidgetMac):
 
   def importDataSeries(self):
     # greedy import of data
-    cycleColors = [[0.886, 0.290, 0.2, 1.0], [0.204, 0.541, 0.741, 1.0], [0.596, 0.557, 0.835, 1.0]]
-    cycleColors.extend([[0.467, 0.467, 0.467, 1.0], [0.984, 0.757, 0.369, 1.0], [0.557, 0.729, 0.259, 1.0]])
     # check whether any data has been loaded
     if((self.tableWidget.tableModel == None) or (self.tableWidget.tableModel.rowCount() == 0)):
       self.parent.statusbar.showMessage('Open a data file first!', self.parent.STATUS_TIME)
@@ -1985,26 +2278,30 @@ class DataArea(QWidgetMac):
         
         # change dataset style to line and no symbol
         style = self.parent.data[self.parent.activeData].getStyle()
+        styleChanges = {}
         if(style['linestyle'] == 'None'):
-          self.parent.data[self.parent.activeData].setStyle('linestyle', 'solid', redraw=False)
+          styleChanges['linestyle'] = 'solid'
         if(style['marker'] != 'None'):
-          self.parent.data[self.parent.activeData].setStyle('marker', 'None', redraw=False)
+          styleChanges['marker'] = 'None'
+        self.parent.data[self.parent.activeData].setStyles(styleChanges, redraw=False)
         
         # loop over columns
         successes = 0
         currY = originalY
+        assignedColumns = set(roles.values())
         while((currY < columnCount) and (successes < 100)):
           # check whether current column is already assigned to sth. else
-          if((currY == originalY) or (not (currY in list(roles.values())))):
-            # update status message as this can take a while
-            self.parent.statusbar.showMessage('Now processing column ' + str(currY + 1) + '!', self.parent.STATUS_TIME)
+          if((currY == originalY) or (not (currY in assignedColumns))):
+            # update status message as this can take a while (but not for every column)
+            if(not ((currY - originalY) % 10)):
+              self.parent.statusbar.showMessage('Now processing column ' + str(currY + 1) + '!', self.parent.STATUS_TIME)
             # set current color
-            currColor = (currY - originalY) % len(cycleColors)
-            self.parent.data[self.parent.activeData].setStyle('color', cycleColors[currColor], redraw=False)
+            currColor = (currY - originalY) % len(CYCLE_COLORS)
+            self.parent.data[self.parent.activeData].setStyles({'color': list(CYCLE_COLORS[currColor])}, redraw=False)
             # assign new y column
             self.tableWidget.roles['y'] = currY
             # get the new data
-            self.updateData(docheck=False, redraw=False, quiet=True)
+            self.updateData(docheck=False, redraw=False, quiet=True, background=False)
             # check the new data
             nuData = self.parent.data[self.parent.activeData].value()
             if(('x' in nuData) and (len(nuData['x']))):
@@ -2033,29 +2330,34 @@ class DataArea(QWidgetMac):
         self.parent.plotArea.dataplotwidget.myRefresh()
         self.parent.plotArea.residplotwidget.myRefresh()
 
-  def updateData(self, docheck=False, redraw=True, quiet=False):
+  def updateData(self, docheck=False, redraw=True, quiet=False, *, background=True):
+    # ensure that transform controls are available
+    self.buildDeferredUI()
     # check whether autoimport enabled
     if ((not docheck) or (self.refreshCheck.isChecked())):
       # check whether any data has been loaded
       if((self.tableWidget.tableModel == None) or (self.tableWidget.tableModel.rowCount() == 0)):
         self.parent.statusbar.showMessage('Open a data file first!', self.parent.STATUS_TIME)
       else:
+        # wait cursor is restored once the (background) processing has been assigned
         QtWidgets.QApplication.setOverrideCursor(QtGui.QCursor(QtCore.Qt.WaitCursor))
-        QtCore.QCoreApplication.processEvents()
         
         # get and process data
         new_data, roles = self.tableWidget.getData()
         if('labels' in roles):
           # separate numerical data from labels
           labelCol = roles.index('labels')
-          labels = [i[labelCol] for i in new_data]
-          new_data = [[k for j, k in enumerate(i) if j != labelCol] for i in new_data]
           newRoles = [i for i in roles if i != 'labels']
+          if(len(new_data)):
+            new_data = np.array(new_data, dtype=object)
+            labels = np.array(new_data[:, labelCol].tolist())
+            new_data = np.delete(new_data, labelCol, axis=1).astype(float)
+          else:
+            labels, new_data = np.array([]), np.array([])
         else:
-          labels = []
+          labels = np.array([])
           newRoles = roles
-        labels = np.array(labels)
-        new_data = np.array(new_data)
+          new_data = np.asarray(new_data)
 
         # check for presence of x and y
         if((not 'x' in roles) or (not 'y' in roles)):
@@ -2075,207 +2377,370 @@ class DataArea(QWidgetMac):
               if(not quiet):
                 self.parent.statusbar.showMessage('Select some data to import them!', self.parent.STATUS_TIME)
           elif ((len(array_dim) > 1) and (array_dim[1] > 1)):
-            # process the error model
-            if(1 <= self.errorModel <= 2):
-              if(self.errorModel == 1):
-                # use const
-                errors = [self.errorConst] * array_dim[0]
-                errors = np.array(errors)
-              elif(self.errorModel ==2):
-                # use percentage of y
-                if('y' in newRoles):
-                  index = newRoles.index('y')
-                  errors = [self.errorPercent/100.0 * i for i in new_data[:,index]]
-                  errors = np.array(errors)
-                  #errors = errors.transpose()
-                else:
-                  if(not quiet):
-                    self.parent.statusbar.showMessage('Cannot locate y values for percentage error calculation!', self.parent.STATUS_TIME)
-                  
-              # check if y-error column already exists
-              if('yerr' in newRoles):
-                index = newRoles.index('yerr')
-                new_data[:,index] = errors
-              else:
-                newRoles.append('yerr')
-                # repackage errors to enable hstacking
-                errors = [[i] for i in errors]
-                errors = np.array(errors)
-                new_data = np.hstack((new_data, errors))
-            elif(self.errorModel == 3):
-              # no errors => possibly delete yerr column
-              if('yerr' in newRoles):
-                index = newRoles.index('yerr')
-                newRoles.pop(index)
-                new_data = np.delete(new_data, index, 1)
-              
-            # process the data reduction model
-            if(self.reductionModel != 0):
-              if(self.reductionModel == 1):
-                # skip data points by numpy slicing
-                new_data = new_data[::self.reductionSkip + 1]
-                if('labels' in roles):
-                  labels = labels[::self.reductionSkip + 1]
-              elif(self.reductionModel == 2):
-                # average with error propagation
-                if('labels' in roles):
-                  new_data, labels = self.movingAverage(sourceData=new_data, roles=newRoles, average=self.reductionAvg, stepsize=self.reductionAvg, labels=labels)
-                else:
-                  new_data = self.movingAverage(sourceData=new_data, roles=newRoles, average=self.reductionAvg, stepsize=self.reductionAvg)
-              elif(self.reductionModel == 3):
-                # moving average with error propagation
-                if('labels' in roles):
-                  new_data, labels = self.movingAverage(sourceData=new_data, roles=newRoles, average=self.reductionMovAvg, stepsize=1, labels=labels)
-                else:
-                  new_data = self.movingAverage(sourceData=new_data, roles=newRoles, average=self.reductionMovAvg, stepsize=1)
-              elif(self.reductionModel == 4):
-                # logarithmic data reduction
-                if('labels' in roles):
-                  new_data, labels = self.logAverage(sourceData=new_data, roles=newRoles, targetpoints=self.reductionLog, labels=labels)
-                else:
-                  new_data = self.logAverage(sourceData=new_data, roles=newRoles, targetpoints=self.reductionLog)
-                
-            # do data transform if necessary
-            # make copy of original data in case we also have to transform y axis
-            if(self.dataTransformYCheck.isChecked()):
-              new_data2 = copy.deepcopy(new_data)
-            if(self.dataTransformXCheck.isChecked()):
-              formula = str(self.dataTransformXEntry.text())
-              if(len(formula) > 0):
-                # transformer
-                formula = 'x = ' + formula
-                new_data = self.transformer(sourceData=new_data, roles=newRoles, formula=formula, axis='x')
-              else:
-                if(not quiet):
-                  self.parent.statusbar.showMessage('Enter formula for x transformation!', self.parent.STATUS_TIME)
-                
-            if(self.dataTransformYCheck.isChecked()):
-              formula = str(self.dataTransformYEntry.text())
-              if(len(formula) > 0):
-                # transformer
-                formula = 'y = ' + formula
-                new_data2 = self.transformer(sourceData=new_data2, roles=newRoles, formula=formula, axis='y')
-                # replace y and yerr columns in new_data
-                ycol = newRoles.index('y')
-                new_data[:,ycol] = new_data2[:,ycol]
-                # do error propagation?
-                if(('yerr' in newRoles) and self.errorPropagate):
-                  yerrcol = newRoles.index('yerr')
-                  new_data[:,yerrcol] = new_data2[:,yerrcol]
-              else:
-                if(not quiet):
-                  self.parent.statusbar.showMessage('Enter formula for y transformation!', self.parent.STATUS_TIME)
-                
-            # delete all rows with non-numerical content
-            for role in newRoles:
-              index = newRoles.index(role)
-              if('labels' in roles):
-                labels = labels[np.isfinite(new_data[:,index])]
-              new_data = new_data[np.isfinite(new_data[:,index])]
-  
-            # assign new data
-            if('labels' in roles):
-              labels = list(labels)
-              self.parent.data[self.parent.activeData].setData(new_data, newRoles, labels=labels)
+            # read transform settings here as worker must not access GUI
+            formulaX, formulaY = None, None
+            for axis, check, entry in [('x', self.dataTransformXCheck, self.dataTransformXEntry), ('y', self.dataTransformYCheck, self.dataTransformYEntry)]:
+              if(check.isChecked()):
+                formula = str(entry.text())
+                if(len(formula) > 0):
+                  if(axis == 'x'):
+                    formulaX = 'x = ' + formula
+                  else:
+                    formulaY = 'y = ' + formula
+                elif(not quiet):
+                  self.parent.statusbar.showMessage('Enter formula for ' + axis + ' transformation!', self.parent.STATUS_TIME)
+
+            # snapshot processing settings and target data set as user may alter them while worker is running
+            settings = self.getProcessSettings()
+            dataobject = self.parent.data[self.parent.activeData]
+            # process data and assign results (superseding any import still in progress)
+            hasLabels = ('labels' in roles)
+            self.dataGeneration += 1
+            if(background):
+              worker = DataWorker(self.processData, new_data, newRoles, labels, hasLabels, settings, formulaX=formulaX, formulaY=formulaY)
+              worker.signals.error.connect(self.reportWorkerError)
+              worker.signals.finished.connect(partial(self.assignData, self.dataGeneration, dataobject, redraw, quiet, hasLabels, True))
+              # keep reference until worker reports back
+              self.dataWorker = worker
+              self.threadPool.start(worker)
+              return
             else:
-              self.parent.data[self.parent.activeData].setData(new_data, newRoles)
-              
-            # here we should update the plot
-            self.parent.data[self.parent.activeData].handleData, self.parent.data[self.parent.activeData].handleErr,\
-              self.parent.data[self.parent.activeData].handleBar, self.parent.data[self.parent.activeData].handleStack= \
-              self.parent.plotArea.plotData(self.parent.data[self.parent.activeData].value(), dataobject = self.parent.data[self.parent.activeData], \
-              handleData = self.parent.data[self.parent.activeData].handleData, handleErr = self.parent.data[self.parent.activeData].handleErr,\
-              handleBar = self.parent.data[self.parent.activeData].handleBar, handleStack = self.parent.data[self.parent.activeData].handleStack,\
-              redraw=False)
-            # and we should redraw the fit function to cover new x-range
-            self.parent.fit[self.parent.activeFit].handlePlot = self.parent.plotArea.plotFunction(\
-              fitobject=self.parent.fit[self.parent.activeFit], x=[], handlePlot=self.parent.fit[self.parent.activeFit].handlePlot,\
-              redraw=False)
-            # and we should update the legend
-            self.updateLegend(redraw=redraw)
-            # and we should update the corresponding residuals
-            self.parent.data[self.parent.activeData].handleResid, self.parent.plotArea.handleResidZero = self.parent.plotArea.plotResid(\
-              dataobject = self.parent.data[self.parent.activeData], handleResid = self.parent.data[self.parent.activeData].handleResid,\
-              handleResidZero = self.parent.plotArea.handleResidZero, redraw=False)
-            # and we should update the resid plot (as x-axis will most likely have rescaled)
-            self.parent.plotArea.setAxisLimits(lower=self.parent.plotArea.minX, upper=self.parent.plotArea.maxX, axis='x',\
-              updateLabel=False, target='resid', redraw=False)
-            # draw resid line (again) to ensure coverage of entire x range
-            self.parent.plotArea.handleResidZero = self.parent.plotArea.plotResidZero(self.parent.plotArea.handleResidZero, redraw=redraw)
-            
-            # and we should update the results table
-            if('labels' in roles):
-              self.parent.resultsarea.updateResults(new_data, newRoles, labels=labels)
-            else:
-              self.parent.resultsarea.updateResults(new_data, newRoles)
+              result = self.processData(new_data, newRoles, labels, hasLabels, settings, formulaX=formulaX, formulaY=formulaY)
+              self.assignData(self.dataGeneration, dataobject, redraw, quiet, hasLabels, False, result)
           
         QtWidgets.QApplication.restoreOverrideCursor()
 
-  def transformer(self, sourceData=None, roles=None, formula='', axis='x'):
-    self.EPSILON = 1e-9
+  def getProcessSettings(self):
+    # returns read-only copy of settings used by data processing
+    keys = ['errorModel', 'errorConst', 'errorPercent', 'errorPropagate', 'reductionModel', 'reductionSkip', 'reductionAvg', 'reductionMovAvg', 'reductionLog']
+    return MappingProxyType({key: getattr(self, key) for key in keys})
+
+  def processData(self, new_data, newRoles, labels, hasLabels, settings, formulaX=None, formulaY=None):
+    # applies error model, data reduction and transforms (does not touch GUI and can thus run on worker thread)
+    messages = []
+    # store data column-wise so that each role is a contiguous array
+    new_data = np.asfortranarray(new_data, dtype=float)
+    array_dim = new_data.shape
+    # cache column indices of roles
+    roleIndex = {role: index for index, role in enumerate(newRoles)}
+    # process the error model
+    if(settings['errorModel'] == 0):
+      # use error column as measured (most common case, nothing to do)
+      pass
+    elif(settings['errorModel'] == 3):
+      # no errors => possibly delete yerr column
+      if('yerr' in roleIndex):
+        index = roleIndex['yerr']
+        newRoles.pop(index)
+        # gather remaining columns in one go
+        keep = np.r_[0:index, index + 1:new_data.shape[1]]
+        new_data = np.asfortranarray(new_data[:, keep])
+        roleIndex = {role: index for index, role in enumerate(newRoles)}
+    elif(1 <= settings['errorModel'] <= 2):
+      errors = None
+      if(settings['errorModel'] == 1):
+        # use const
+        errors = np.full(array_dim[0], settings['errorConst'])
+      elif('y' in roleIndex):
+        # use percentage of y
+        errors = (settings['errorPercent'] / 100.0) * new_data[:,roleIndex['y']]
+      else:
+        messages.append('Cannot locate y values for percentage error calculation!')
+          
+      # check if y-error column already exists
+      if(type(errors) == type(None)):
+        pass
+      elif('yerr' in roleIndex):
+        new_data[:,roleIndex['yerr']] = errors
+      else:
+        roleIndex['yerr'] = len(newRoles)
+        newRoles.append('yerr')
+        # append error column to single preallocated array
+        extended_data = np.empty((array_dim[0], array_dim[1] + 1), dtype=np.result_type(new_data, errors), order='F')
+        extended_data[:, :-1] = new_data
+        extended_data[:, -1] = errors
+        new_data = extended_data
+      
+    # process the data reduction model
+    if(settings['reductionModel'] == 1):
+      # skip data points by numpy slicing (views, no copy)
+      step = settings['reductionSkip'] + 1
+      new_data = new_data[::step]
+      if(hasLabels):
+        labels = labels[::step]
+    elif(2 <= settings['reductionModel'] <= 4):
+      if(settings['reductionModel'] == 2):
+        # average with error propagation
+        reducer = partial(self.movingAverage, average=settings['reductionAvg'], stepsize=settings['reductionAvg'])
+      elif(settings['reductionModel'] == 3):
+        # moving average with error propagation
+        reducer = partial(self.movingAverage, average=settings['reductionMovAvg'], stepsize=1)
+      else:
+        # logarithmic data reduction
+        reducer = partial(self.logAverage, targetpoints=settings['reductionLog'], messages=messages)
+      if(hasLabels):
+        new_data, labels = reducer(sourceData=new_data, roles=newRoles, labels=labels)
+      else:
+        new_data = reducer(sourceData=new_data, roles=newRoles)
+        
+    # do data transform if necessary
+    # make copy of original data in case we also have to transform y axis
+    if(formulaY != None):
+      new_data2 = new_data.copy()
+    if(formulaX != None):
+      new_data = self.transformer(sourceData=new_data, roles=newRoles, formula=formulaX, axis='x', messages=messages)
+        
+    if(formulaY != None):
+      new_data2 = self.transformer(sourceData=new_data2, roles=newRoles, formula=formulaY, axis='y', messages=messages)
+      # replace y and yerr columns in new_data
+      ycol = roleIndex['y']
+      new_data[:,ycol] = new_data2[:,ycol]
+      # do error propagation?
+      if(('yerr' in roleIndex) and settings['errorPropagate']):
+        yerrcol = roleIndex['yerr']
+        new_data[:,yerrcol] = new_data2[:,yerrcol]
+        
+    # delete all rows with non-numerical content
+    finiteRows = np.isfinite(new_data).all(axis=1)
+    if(hasLabels):
+      labels = labels[finiteRows]
+    new_data = new_data[finiteRows]
+
+    return new_data, newRoles, labels, messages
+
+  def assignData(self, generation, dataobject, redraw, quiet, hasLabels, background, result=None):
+    # assigns processed data to data set that was active when import was started and updates plots
+    if(generation != self.dataGeneration):
+      # superseded by more recent import
+      pass
+    elif(result == None):
+      self.parent.statusbar.showMessage('Error when processing data!', self.parent.STATUS_TIME)
+    else:
+      new_data, newRoles, labels, messages = result
+      if(len(messages) and (not quiet)):
+        self.parent.statusbar.showMessage(messages[-1], self.parent.STATUS_TIME)
+      # assign new data
+      if(hasLabels):
+        labels = list(labels)
+        dataobject.setData(new_data, newRoles, labels=labels)
+      else:
+        dataobject.setData(new_data, newRoles)
+      
+      # queue plot update for this data set
+      if(not dataobject in self.refreshPending):
+        self.refreshPending.append(dataobject)
+      self.refreshRedraw = self.refreshRedraw or redraw
+      if(hasLabels):
+        self.refreshResults = (new_data, newRoles, labels)
+      else:
+        self.refreshResults = (new_data, newRoles, None)
+      if(not background):
+        # caller relies on plots being up to date
+        self.applyPlotRefresh()
+      elif(not self.refreshScheduled):
+        # coalesce results arriving in quick succession into a single plot update
+        self.refreshScheduled = True
+        QtCore.QTimer.singleShot(0, self.applyPlotRefresh)
+    if(background):
+      QtWidgets.QApplication.restoreOverrideCursor()
+
+  def reportWorkerError(self, message):
+    # logs exceptions raised during background processing
+    print('Failed to process data\n' + message)
+
+  def applyPlotRefresh(self):
+    # plots queued data sets and updates dependent curves, legend and results
+    pending, redraw, results = self.refreshPending, self.refreshRedraw, self.refreshResults
+    self.refreshPending, self.refreshRedraw, self.refreshResults, self.refreshScheduled = [], False, None, False
+    if(not len(pending)):
+      return
+    for dataobject in pending:
+      # here we should update the plot
+      dataobject.handleData, dataobject.handleErr, dataobject.handleBar, dataobject.handleStack = \
+        self.parent.plotArea.plotData(dataobject.value(), dataobject = dataobject, \
+        handleData = dataobject.handleData, handleErr = dataobject.handleErr,\
+        handleBar = dataobject.handleBar, handleStack = dataobject.handleStack,\
+        redraw=False)
+    # and we should redraw the fit function to cover new x-range
+    self.parent.fit[self.parent.activeFit].handlePlot = self.parent.plotArea.plotFunction(\
+      fitobject=self.parent.fit[self.parent.activeFit], x=[], handlePlot=self.parent.fit[self.parent.activeFit].handlePlot,\
+      redraw=False)
+    # and we should update the legend
+    self.updateLegend(redraw=redraw)
+    # and we should update the corresponding residuals
+    for dataobject in pending:
+      dataobject.handleResid, self.parent.plotArea.handleResidZero = self.parent.plotArea.plotResid(\
+        dataobject = dataobject, handleResid = dataobject.handleResid,\
+        handleResidZero = self.parent.plotArea.handleResidZero, redraw=False)
+    # and we should update the resid plot (as x-axis will most likely have rescaled)
+    self.parent.plotArea.setAxisLimits(lower=self.parent.plotArea.minX, upper=self.parent.plotArea.maxX, axis='x',\
+      updateLabel=False, target='resid', redraw=False)
+    # draw resid line (again) to ensure coverage of entire x range
+    self.parent.plotArea.handleResidZero = self.parent.plotArea.plotResidZero(self.parent.plotArea.handleResidZero, redraw=redraw)
+    
+    # and we should update the results table
+    new_data, newRoles, labels = results
+    if(labels != None):
+      self.parent.resultsarea.updateResults(new_data, newRoles, labels=labels)
+    else:
+      self.parent.resultsarea.updateResults(new_data, newRoles)
+
+  def showStatus(self, message, messages=None):
+    # shows status message or collects it if called from worker thread
+    if(messages != None):
+      messages.append(message)
+    else:
+      self.parent.statusbar.showMessage(message, self.parent.STATUS_TIME)
+
+  def getTransform(self, formula, axis):
+    # returns transformation function, compiling it only when formula has changed
+    key = (formula, axis)
+    with self.transformLock:
+      if(key not in self.transformCache):
+        self.transformCache[key] = self.compileTransform(formula, axis)
+      return self.transformCache[key]
+
+  def precompileTransform(self, axis='x', entry=None):
+    # compiles transformation on worker thread as soon as formula has been entered (errors surface upon import)
+    formula = str(entry.text())
+    if(len(formula) > 0):
+      worker = DataWorker(self.getTransform, axis + ' = ' + formula, axis)
+      # keep reference until worker is done
+      self.compileWorker = worker
+      self.threadPool.start(worker)
+
+  def compileTransform(self, formula, axis):
+    # compiles transformation function once per formula
+    funcstr = 'def transformThis(self, x, y):'
+    funcstr += '\n\t' + formula + '\n\treturn ' + axis
+    # generate ffunc in local namespace (this is needed for Python3 vs. Python2, bummer)
+    namespace = self.mySpace
+    exec(funcstr, namespace)
+    transformFunc = namespace['transformThis']
+    # simple assignments to the target axis are evaluated by numexpr if available (no compile latency)
+    target, sep, expression = formula.partition('=')
+    expression = expression.strip()
+    if((numexpr == None) or (target.strip() != axis) or (';' in expression) or ('\n' in expression) or (not self.numexprSupports(expression))):
+      # compile formula with numba if available (falls back to Python for unsupported formulas)
+      if(numba != None):
+        transformFunc = self.jitTransform(formula, axis, transformFunc)
+      return transformFunc
+
+    def transformNumexpr(self, x, y):
+      try:
+        return numexpr.evaluate(expression, local_dict={'x': x, 'y': y}, global_dict={})
+      except Exception:
+        # problem with current data => fall back to Python function for this call only
+        return transformFunc(self, x, y)
+
+    return transformNumexpr
+
+  def numexprSupports(self, expression):
+    # checks once whether numexpr can evaluate expression at all
+    try:
+      numexpr.evaluate(expression, local_dict={'x': np.ones(1), 'y': np.ones(1)}, global_dict={})
+    except Exception:
+      return False
+    return True
+
+  def jitTransform(self, formula, axis, transformFunc):
+    # wraps numba-compiled version of transformation function
+    funcstr = 'def transformJit(x, y):'
+    funcstr += '\n\t' + formula + '\n\treturn ' + axis
+    namespace = self.mySpace
+    exec(funcstr, namespace)
+    # compile scalar kernel eagerly with fixed C signature (not cached to disk as numba cannot cache functions without source file)
+    try:
+      scalarFunc = numba.njit('float64(float64, float64)')(namespace['transformJit'])
+    except Exception:
+      # formula not supported by numba
+      return transformFunc
+
+    # evaluate formula element-wise in parallel
+    # compiled eagerly such that typing errors surface here rather than during evaluation
+    try:
+      @numba.njit('float64[:](float64[:], float64[:])', parallel=True)
+      def jitFunc(x, y):
+        result = np.empty(x.size)
+        for index in numba.prange(x.size):
+          result[index] = scalarFunc(x[index], y[index])
+        return result
+    except Exception:
+      return transformFunc
+
+    def transformJitted(self, x, y):
+      try:
+        x, y = np.broadcast_arrays(np.asarray(x, dtype=float), np.asarray(y, dtype=float))
+        # numba's default threading layer must not be entered concurrently
+        with self.jitLock:
+          return jitFunc(np.ascontiguousarray(x).ravel(), np.ascontiguousarray(y).ravel()).reshape(x.shape)
+      except Exception:
+        # problem with current data (e.g., division by zero) => fall back to Python for this call only
+        return transformFunc(self, x, y)
+
+    return transformJitted
+
+  def propagateError(self, transformFunc, xval, yval, newVal, xerrval=None, yerrval=None):
+    # numerically determines derivatives in x and y and accumulates propagated error
+    newErr = np.zeros(np.shape(xval))
+    for errval, shiftX in [(xerrval, True), (yerrval, False)]:
+      if(type(errval) != type(None)):
+        try:
+          # step size scaled to values but bounded from below (optimal for central differences)
+          val = xval if(shiftX) else yval
+          step = STEP_SCALE * np.maximum(np.abs(val), 1.0)
+          if(shiftX):
+            upper, lower = transformFunc(self, xval + step, yval), transformFunc(self, xval - step, yval)
+          else:
+            upper, lower = transformFunc(self, xval, yval + step), transformFunc(self, xval, yval - step)
+          deriv = np.subtract(upper, lower) / (2 * step)
+          # revert to forward difference where lower point is outside function domain
+          forward = ~np.isfinite(deriv)
+          if(forward.any()):
+            deriv[forward] = (np.subtract(upper, newVal) / step)[forward]
+          # scale derivative by error and add in quadrature (in place)
+          deriv *= errval
+          np.hypot(newErr, deriv, out=newErr)
+        except:
+          pass
+    return newErr
+
+  def transformer(self, sourceData=None, roles=None, formula='', axis='x', messages=None):
     # does axis transform
     if(axis in ['x', 'y']):
       if(type(sourceData) != type(None)):
         if(axis in roles):
           # try defining transformation function
           try:
-            funcstr = 'def transformThis(self, x, y):'
-            funcstr += '\n\t' + formula + '\n\treturn ' + axis
-            # generate ffunc in local namespace (this is needed for Python3 vs. Python2, bummer)
-            namespace = self.mySpace
-            exec(funcstr, namespace)
-            # now define the new function in the object scope
-            setattr(DataArea, 'transformThis', namespace['transformThis'])
+            transformFunc = self.getTransform(formula, axis)
           except:
-            self.parent.statusbar.showMessage('Error when setting transformation for ' + axis, self.parent.STATUS_TIME)
+            self.showStatus('Error when setting transformation for ' + axis, messages)
           else:
             # do the actual transform
-            index = roles.index(axis); #val = sourceData[:,index]
-            xindex = roles.index('x'); xval = copy.deepcopy(sourceData[:,xindex])
-            yindex = roles.index('y'); yval = copy.deepcopy(sourceData[:,yindex])
+            roleIndex = {role: index for index, role in enumerate(roles)}
+            index = roleIndex[axis]
+            xval = sourceData[:,roleIndex['x']].copy()
+            yval = sourceData[:,roleIndex['y']].copy()
             try:
-              newVal = self.transformThis(xval, yval)
+              newVal = transformFunc(self, xval, yval)
               # now copy transformed data to data matrix
               sourceData[:,index] = newVal
             except:
-              self.parent.statusbar.showMessage('Error when calculating transform for ' + axis, self.parent.STATUS_TIME)
+              self.showStatus('Error when calculating transform for ' + axis, messages)
             else:
               # deal with data errors
               errname = axis + 'err'
-              if(errname in roles):
-                errindex = roles.index(errname)
-                # numerically determine derivatives in x and y
-                # consider x
-                if('xerr' in roles):
-                  xerrindex = roles.index('xerr'); xerrval = sourceData[:,xerrindex]; xerrval = xerrval ** 2
-                  try:
-                    xderiv = self.transformThis(xval + self.EPSILON, yval)
-                    xderiv = (xderiv - newVal) / self.EPSILON
-                    xderiv = xderiv ** 2
-                    newErr = xerrval * xderiv
-                  except:
-                    pass
-                else:
-                  newErr = np.array([0] * len(newVal))
-                
-                # consider y
-                if('yerr' in roles):
-                  yerrindex = roles.index('yerr'); yerrval = sourceData[:,yerrindex]; yerrval = yerrval ** 2
-                  try:
-                    yderiv = self.transformThis(xval, yval + self.EPSILON)
-                    yderiv = (yderiv - newVal) / self.EPSILON
-                    yderiv = yderiv ** 2
-                    newErr = newErr + (yerrval * yderiv)
-                  except:
-                    pass
-                  
-                # calculate root of error
-                newErr = newErr ** 0.5
-                sourceData[:,errindex] = newErr
+              if(errname in roleIndex):
+                xerrval, yerrval = None, None
+                if('xerr' in roleIndex):
+                  xerrval = sourceData[:,roleIndex['xerr']]
+                if('yerr' in roleIndex):
+                  yerrval = sourceData[:,roleIndex['yerr']]
+                sourceData[:,roleIndex[errname]] = self.propagateError(transformFunc, xval, yval, newVal, xerrval, yerrval)
 
     return sourceData
 
-  def logAverage(self, sourceData=None, roles=None, targetpoints=100, labels=np.array([])):
+  def logAverage(self, sourceData=None, roles=None, targetpoints=100, labels=np.array([]), messages=None):
     # reduces data logarithmically to (approx.) target no. of points
     if(type(sourceData) != type(None)):
       if(('x' in roles) and ('y' in roles)):
@@ -2289,108 +2754,103 @@ class DataArea(QWidgetMac):
           # calculate target x values on log-spaced scale
           logXval = np.linspace(np.log(np.min(posXval)), np.log(np.max(posXval)), targetpoints)
           targetXval = np.exp(logXval)
-          targetBoundary = [0]
-          targetBoundary.extend([(targetXval[i] + targetXval[i+1])/2 for i in range(len(targetXval)-1)])
-          targetBoundary.append(targetXval[-1])
-
-          # cycle through boundary list
-          output = np.array([]); avgLabels = []
-          for index, entry in enumerate(targetBoundary[:-1]):
-            targetRows = sourceData[sourceData[:,xcol] > targetBoundary[index]]
-            labelIndex = len(sourceData[sourceData[:,xcol] <= targetBoundary[index]])
-            targetRows = targetRows[targetRows[:,xcol] <= targetBoundary[index+1]]
-          
-            # check current entry
-            if(targetRows.size > 0):
-              if((len(targetRows.shape) > 1) and (targetRows.shape[0] > 1)):
-                # calculate averages
-                newRow = []
-                for index2, entry2 in enumerate(roles):
-                  if(entry2 in ['x', 'y']):
-                    # numerically average x and y values
-                    newRow.append(np.average(targetRows[:,index2]))
-                  elif(entry2 in ['xerr', 'yerr']):
-                    errVal = (targetRows[:,index2] / len(targetRows[:,index2])) ** 2
-                    errVal = np.sum(errVal) ** 0.5
-                    newRow.append(errVal)
-                    
-                targetRows = np.array(newRow)
-                
-              if(labels.size):
-                avgLabels.append(labels[labelIndex])
+          targetBoundary = np.concatenate(([0], (targetXval[:-1] + targetXval[1:]) / 2, targetXval[-1:]))
 
-              # append current line to output
-              if(len(output) > 0):
-                output = np.vstack((output, targetRows))
-              else:
-                output = targetRows
-          
+          # sort by x (unless already sorted) and locate bin boundaries (bins include upper boundary)
+          if(np.all(xval[1:] >= xval[:-1])):
+            order = None
+            edges = np.searchsorted(xval, targetBoundary, side='right')
+          else:
+            order = np.argsort(xval, kind='stable')
+            edges = np.searchsorted(xval[order], targetBoundary, side='right')
+          starts, counts = edges[:-1], np.diff(edges)
+          # only keep occupied bins which are contiguous in sorted data
+          occupied = counts > 0
+          starts, counts = starts[occupied], counts[occupied]
+          if(type(order) == type(None)):
+            sortedData = sourceData[edges[0]:edges[-1]]
+          else:
+            sortedData = sourceData[order[edges[0]:edges[-1]]]
+          binStarts = starts - edges[0]
+
+          # sum up all bins in one go
+          output = np.empty((len(starts), sourceData.shape[1]), order='F')
+          for index, entry in enumerate(roles):
+            if(entry in ['xerr', 'yerr']):
+              # propagate errors
+              output[:,index] = np.add.reduceat(sortedData[:,index] ** 2, binStarts) ** 0.5 / counts
+            else:
+              # numerically average x and y values
+              output[:,index] = np.add.reduceat(sortedData[:,index], binStarts) / counts
+          # use label of first data point in each bin
           if(labels.size):
-            return output, np.array(avgLabels)
+            return output, labels[starts]
           else:
             return output
   
         else:
-          self.parent.statusbar.showMessage('No positive x values, cannot do any reduction!', self.parent.STATUS_TIME)
+          self.showStatus('No positive x values, cannot do any reduction!', messages)
+          if(labels.size):
+            return sourceData, labels
           return sourceData
 
+  def windowSum(self, values, average=1, stepsize=1):
+    # sums over sliding windows of length average (windows with non-finite values become nan)
+    invalid = ~np.isfinite(values)
+    if((bottleneck != None) and (average <= len(values))):
+      return bottleneck.move_sum(np.where(invalid, np.nan, values), window=average)[average - 1::stepsize]
+    # otherwise via cumulative sum, keeping non-finite values from spilling into later windows
+    cumSum = np.concatenate(([0.0], np.cumsum(np.where(invalid, 0.0, values))))
+    windowSum = (cumSum[average:] - cumSum[:-average])[::stepsize]
+    if(invalid.any()):
+      cumInvalid = np.concatenate(([0], np.cumsum(invalid)))
+      windowSum[(cumInvalid[average:] - cumInvalid[:-average])[::stepsize] > 0] = np.nan
+    return windowSum
+
   def movingAverage(self, sourceData=None, roles=None, average=1, stepsize=1, labels=np.array([])):
     # calculate a moving average with error propagation
     if(type(sourceData) != type(None)):
       if(('x' in roles) and ('y' in roles)):
         # locate x and y values
-        xcol = roles.index('x'); ycol = roles.index('y')
-        xval = sourceData[:,xcol]
-        yval = sourceData[:,ycol]
+        roleIndex = {role: index for index, role in enumerate(roles)}
+        xval = sourceData[:,roleIndex['x']]
+        yval = sourceData[:,roleIndex['y']]
         # moving average
-        avgXval = np.array([np.average(xval[i:i+average]) for i in range(0, len(xval) - average + 1, stepsize)])
-        avgYval = np.array([np.average(yval[i:i+average]) for i in range(0, len(yval) - average + 1, stepsize)])
+        avgXval = self.windowSum(xval, average, stepsize) / average
+        avgYval = self.windowSum(yval, average, stepsize) / average
         # check for presence of error values
-        if('yerr' in roles):
+        if('yerr' in roleIndex):
           # need to do error propagation
-          yerrcol = roles.index('yerr')
-          yerrval = sourceData[:,yerrcol]
+          yerrval = sourceData[:,roleIndex['yerr']]
           yerrval = (yerrval / average) ** 2
           # error propagation
-          avgYerrval = np.array([np.sum(yerrval[i:i+average]) for i in range(0, len(yerrval) - average + 1, stepsize)])
-          avgYerrval = avgYerrval ** 0.5
-        elif('xerr' in roles):
+          avgYerrval = self.windowSum(yerrval, average, stepsize) ** 0.5
+        if('xerr' in roleIndex):
           # need to do error propagation
-          xerrcol = roles.index('xerr')
-          xerrval = sourceData[:,xerrcol] 
+          xerrval = sourceData[:,roleIndex['xerr']]
           xerrval = (xerrval / average) ** 2
           # error propagation
-          avgXerrval = np.array([np.sum(xerrval[i:i+average]) for i in range(len(0, xerrval) - average + 1, stepsize)])
-          avgXerrval = avgXerrval ** 0.5
+          avgXerrval = self.windowSum(xerrval, average, stepsize) ** 0.5
           
         # deal with data labels
         if(labels.size):
           # use label of first data point to be averaged
-          avgLabel = np.array([labels[i] for i in range(0, len(xval) - average + 1, stepsize)])
+          avgLabel = labels[:max(len(xval) - average + 1, 0):stepsize]
 
         # now need to assemble columns according to roles
-        procData = np.array([])
-        for entry in roles:
-          # get current column
-          if(entry == 'x'):
-            addItem = avgXval
-          elif(entry == 'y'):
-            addItem = avgYval
-          elif(entry == 'xerr'):
-            addItem = avgXerrval
-          elif(entry == 'yerr'):
-            addItem = avgYerrval
-          
-          # assemble output data
-          if(procData.size > 0):
-            procData = np.vstack((procData, addItem))
-          else:
-            procData = addItem
+        averaged = {'x': avgXval, 'y': avgYval}
+        if('xerr' in roles):
+          averaged['xerr'] = avgXerrval
+        if('yerr' in roles):
+          averaged['yerr'] = avgYerrval
+        procData = np.empty((len(avgXval), len(roles)), order='F')
+        for index, entry in enumerate(roles):
+          procData[:,index] = averaged[entry]
 
         if(labels.size):
-          return procData.transpose(), avgLabel
+          return procData, avgLabel
         else:
-          return procData.transpose()
+          return procData
         
   def loadData(self):
     global REMEMBERDIR
@@ -2531,6 +2991,11 @@ class MatplotlibCanvas(QWidgetMac):
     self.legendLabelColor = [0.0, 0.0, 0.0, 1.0]
     self.legendLabelSize = 14
     self.legendLabelFont = 'DejaVu Sans'
+    self.legendHandle = None
+    self.deferRescale = False
+    # memoize label probes as legend is rebuilt for every legend setting (least recently used ones are dropped first)
+    self.labelProbeCache = OrderedDict()
+    self.labelProbeCacheSize = 512
     self.xkcd = False
     self.xkcdScale, self.xkcdLength, self.xkcdRandomness = 1.0, 100.0, 2.0
     self.xkcdStoreFonts = ['DejaVu Sans']
@@ -2541,6 +3006,7 @@ class MatplotlibCanvas(QWidgetMac):
     self.pathRhoCheck, self.pathRho = True, 0.5
     self.handleArrow = {'x': None, 'y': None}
     self.handleArrowResid = {'x': None, 'y': None}
+    self.hasArrows = False
     self.arrowVisible = {'x': False, 'y': False}
     self.arrowOverhang = {'x': 0.1, 'y': 0.1}
     self.arrowColor = {'x': [0.2, 0.2, 0.2, 1.0], 'y': [0.2, 0.2, 0.2, 1.0]}
@@ -2562,8 +3028,16 @@ class MatplotlibCanvas(QWidgetMac):
     items.extend('tickFont,ticksVisible,ticksWidth,ticksLength,ticksColor,ticksDirection'.split(','))
     items.extend('ticksXColor,ticksYColor,ticksXSize,ticksYSize,ticksXAngle,ticksYAngle'.split(','))
     items.extend('gridVisible,gridWidth,gridStyle,gridDashStyle,gridColor,gridOrder,padSize'.split(','))
+    # settings are plain dicts/lists of immutable values => explicit copy is much cheaper than deepcopy
+    def copySetting(value):
+      if(type(value) == dict):
+        return {key: copySetting(item) for key, item in value.items()}
+      elif(type(value) == list):
+        return [copySetting(item) for item in value]
+      return value
+
     for entry in items:
-      self.__dict__[entry+'_resid'] = copy.deepcopy(self.__dict__[entry])
+      self.__dict__[entry+'_resid'] = copySetting(self.__dict__[entry])
 
     if('bmh' in matplotlib.style.available):
       self.stylemodel = 'bmh'
@@ -2772,18 +3246,56 @@ class MatplotlibCanvas(QWidgetMac):
     self.autoScaleCheckX.setChecked(self.autoScaleX)
     self.autoScaleCheckY.setChecked(self.autoScaleY)
     
+    # defer rescaling and replotting of curves until final limits are known
+    self.deferRescale = True
+    try:
+      self.restoreAxisState()
+    finally:
+      self.deferRescale = False
+
+    # check wether we can go to original values specified in state
+    if(self.modeX == 'linear'):
+      self.minX, self.maxX = orig_minX, orig_maxX
+    else:
+      if(orig_minX > 0):
+        self.minX = orig_minX
+      if(orig_maxX > 0):
+        self.maxX = orig_maxX
+    if(self.modeY == 'linear'):
+      self.minY, self.maxY = orig_minY, orig_maxY
+    else:
+      if(orig_minY > 0):
+        self.minY = orig_minY
+      if(orig_maxY > 0):
+        self.maxY = orig_maxY
+    self.minResidY, self.maxResidY = orig_minResidY, orig_maxResidY
+        
+    # axes limits
+    self.setAxisLimits(lower=self.minX, upper=self.maxX, axis='x', updateLabel=True, target='plot', redraw=False)
+    self.setAxisLimits(lower=self.minX, upper=self.maxX, axis='x', updateLabel=False, target='resid', redraw=False)
+    # redraw fit function and zero line once to cover final x-range
+    self.parent.fit[self.parent.activeFit].handlePlot = self.plotFunction(\
+      fitobject=self.parent.fit[self.parent.activeFit], x=[], handlePlot=self.parent.fit[self.parent.activeFit].handlePlot,\
+      redraw=False)
+    self.handleResidZero = self.plotResidZero(handleResidZero=self.handleResidZero, redraw=False)
+    self.setAxisLimits(lower=self.minY, upper=self.maxY, axis='y', updateLabel=True, target='plot', redraw=False)
+    self.setAxisLimits(lower=self.minResidY, upper=self.maxResidY, axis='y', updateLabel=True, target='resid', redraw=False)
+
+  def restoreAxisState(self):
+    # applies axis modes and tick formatting of restored state
     # axes modes
-    index = self.modeSelectorx.findText(self.modeX)
-    if(index + 1):
-      self.modeSelectorx.blockSignals(True)
-      self.modeSelectorx.setCurrentIndex(index)
-      self.modeSelectorx.blockSignals(False)
+    modeSelectorx, modeSelectory = self.modeSelectorx, self.modeSelectory
+    index = modeSelectorx.findText(self.modeX)
+    if(index >= 0):
+      modeSelectorx.blockSignals(True)
+      modeSelectorx.setCurrentIndex(index)
+      modeSelectorx.blockSignals(False)
       self.changeAxisMode('x', redraw=False)
-    index = self.modeSelectory.findText(self.modeY)
-    if(index + 1):
-      self.modeSelectory.blockSignals(True)
-      self.modeSelectory.setCurrentIndex(index)
-      self.modeSelectory.blockSignals(False)
+    index = modeSelectory.findText(self.modeY)
+    if(index >= 0):
+      modeSelectory.blockSignals(True)
+      modeSelectory.setCurrentIndex(index)
+      modeSelectory.blockSignals(False)
       self.changeAxisMode('y', redraw=False)
     
     # need to counteract resetting of axis ticks when adjusting axis mode
@@ -2821,22 +3333,6 @@ class MatplotlibCanvas(QWidgetMac):
     self.minX, self.maxX = minX, maxX
     self.minY, self.maxY = minY, maxY
     self.minResidY, self.maxResidY = minResidY, maxResidY
-    
-    # check wether we can go to original values specified in state
-    if(self.modeX == 'linear'):
-      self.minX, self.maxX = orig_minX, orig_maxX
-    else:
-      self.minX, self.maxX = [i if (i > 0) else j for i, j in zip([orig_minX, orig_maxX], [self.minX, self.maxX])]
-    if(self.modeY == 'linear'):
-      self.minY, self.maxY = orig_minY, orig_maxY
-    else:
-      self.minY, self.maxY = [i if (i > 0) else j for i, j in zip([orig_minY, orig_maxY], [self.minY, self.maxY])]
-    self.minResidY, self.maxResidY = orig_minResidY, orig_maxResidY
-        
-    # axes limits
-    self.setAxisLimits(lower=self.minX, upper=self.maxX, axis='x', updateLabel=True, target='plot', redraw=False)
-    self.setAxisLimits(lower=self.minY, upper=self.maxY, axis='y', updateLabel=True, target='plot', redraw=False)
-    self.setAxisLimits(lower=self.minResidY, upper=self.maxResidY, axis='y', updateLabel=True, target='resid', redraw=False)
 
   def setZOrderResidLine(self, zorder=0, redraw=True):
     # updates z order of residuals
@@ -2875,44 +3371,64 @@ class MatplotlibCanvas(QWidgetMac):
     
     # build axis legend objects
     items = []
-    for entry in self.parent.data:
-      if((entry.handleData != None) and (entry.visibility)):
+    renderer = getattr(self.matplot.canvas, 'renderer', None)
+    entries = itertools.chain(((entry, entry.handleData, 'data set') for entry in self.parent.data),\
+      ((entry, entry.handlePlot, 'curve') for entry in self.parent.fit))
+    for entry, handle, kind in entries:
+      if((handle != None) and (entry.visibility)):
         # manually process escape characters
-        name = '\n'.join(entry.name.split('\\n'))
-        name = '\t'.join(name.split('\\t'))
-        # test for potential Mathttext errors by creating a dummy text label
-        tempText = axisobject.text(1, 1, name)
-        try:
-          tempText._get_layout(self.matplot.canvas.renderer)
-        except:
+        name = entry.name.replace('\\n', '\n').replace('\\t', '\t')
+        # test for potential Mathttext errors (only labels with $ can fail, result is cached per label)
+        if(('$' in name) and (not self.probeLabel(name, renderer))):
           # some kind of problem with item label
-          self.parent.statusbar.showMessage('Problems with data set label ' + name, self.parent.STATUS_TIME)
+          self.parent.statusbar.showMessage('Problems with ' + kind + ' label ' + name, self.parent.STATUS_TIME)
           name = name.replace('$', '')
-        tempText.remove()
         if(not name.startswith('_')):
-          items.append([entry.handleData, name, entry.zorder])
-    for entry in self.parent.fit:
-      if((entry.handlePlot != None) and (entry.visibility)):
-        # manually process escape characters
-        name = '\n'.join(entry.name.split('\\n'))
-        name = '\t'.join(name.split('\\t'))
-        # test for potential Mathttext errors by creating a dummy text label
-        tempText = axisobject.text(1, 1, name)
-        try:
-          tempText._get_layout(self.matplot.canvas.renderer)
-        except:
-          # some kind of problem with item label
-          self.parent.statusbar.showMessage('Problems with curve label ' + name, self.parent.STATUS_TIME)
-          name = name.replace('$', '')
-        tempText.remove()
-        if(not name.startswith('_')):
-          items.append([entry.handlePlot, name, entry.zorder])
+          items.append([handle, sys.intern(name), entry.zorder])
     # order according to zorder
-    items = sorted(items, key=lambda k: k[2])
+    items = sorted(items, key=operator.itemgetter(2))
     handles = [i[0] for i in items]
     labels = [i[1] for i in items]
     
     self.legendHandle = axisobject.legend(handles, labels, loc=self.legendPlacement, shadow=self.legendShadow)
+    if(self.legendHandle != None):
+      self.styleLegend()
+
+  def probeLabel(self, name, renderer=None):
+    # tests label for potential Mathtext errors (cached per label and font but not per renderer which changes upon resize)
+    if(renderer == None):
+      return False
+    key = (name, self.legendLabelFont, self.legendLabelSize)
+    if(key in self.labelProbeCache):
+      self.labelProbeCache.move_to_end(key)
+    else:
+      self.labelProbeCache[key] = self.labelLayoutValid(name, renderer)
+      if(len(self.labelProbeCache) > self.labelProbeCacheSize):
+        self.labelProbeCache.popitem(last=False)
+    return self.labelProbeCache[key]
+
+  def labelLayoutValid(self, name, renderer):
+    # tests for potential Mathtext errors by creating a dummy text label
+    tempText = self.ax.text(1, 1, name, fontsize=self.legendLabelSize, fontname=self.legendLabelFont)
+    try:
+      tempText._get_layout(renderer)
+      valid = True
+    except:
+      valid = False
+    tempText.remove()
+    return valid
+
+  def restyleLegend(self, axisobject=None):
+    # applies cosmetic legend settings to existing legend (only rebuilds legend if there is none)
+    if(axisobject == None):
+      axisobject = self.ax
+    if((self.legendHandle != None) and (axisobject.get_legend() is self.legendHandle)):
+      self.styleLegend()
+    else:
+      self.legendHelper(axisobject)
+
+  def styleLegend(self):
+    # sets frame and text properties of current legend
     if(self.legendHandle != None):
       # go via frame properties for enhanced controls
       frame = self.legendHandle.get_frame()
@@ -2933,21 +3449,10 @@ class MatplotlibCanvas(QWidgetMac):
       self.legendHandle.set_zorder(999)
       
       # and now remember all this
-      axisname = 'ax'
-      self.rememberSetting['legend'] = 'handleLegend = ' + axisname + '.legend(loc=' + repr(self.legendPlacement) + ', shadow=' + repr(self.legendShadow) + ')\n'
-      self.rememberSetting['legend'] += 'if(handleLegend != None):\n'
-      self.rememberSetting['legend'] += '\tframe = handleLegend.get_frame()\n'
-      self.rememberSetting['legend'] += '\tif(frame != None):\n'
-      self.rememberSetting['legend'] += '\t\tframe.set_linewidth(' + repr(self.legendEdgeWidth) + ')\n'
-      self.rememberSetting['legend'] += '\t\tframe.set_edgecolor(' + repr(self.legendColor['edge']) + ')\n'
-      self.rememberSetting['legend'] += '\t\tframe.set_facecolor(' + repr(self.legendColor['face']) + ')\n'
-      self.rememberSetting['legend'] += '\t\tframe.set_alpha(' + repr(self.legendColor['face'][-1]) + ')\n'
-      self.rememberSetting['legend'] += '\ttexts = handleLegend.texts\n'
-      self.rememberSetting['legend'] += '\tfor entry in texts:\n'
-      self.rememberSetting['legend'] += '\t\tentry.set_color(' + repr(self.legendLabelColor) + ')\n'
-      self.rememberSetting['legend'] += '\t\tentry.set_fontsize(' + repr(self.legendLabelSize) + ')\n'
-      self.rememberSetting['legend'] += '\t\tentry.set_fontname(' + repr(self.legendLabelFont) + ')\n'
-          
+      self.rememberSetting['legend'] = LEGEND_TEMPLATE.format(axis='ax', loc=self.legendPlacement, shadow=self.legendShadow,\
+        edgeWidth=self.legendEdgeWidth, edge=self.legendColor['edge'], face=self.legendColor['face'], alpha=self.legendColor['face'][-1],\
+        labelColor=self.legendLabelColor, labelSize=self.legendLabelSize, labelFont=self.legendLabelFont)
+
   def setLegendPlacement(self, value='best', redraw=True, target='plot'):
     # sets placement of legend
     # check whether to operate on data or resid plot
@@ -2957,12 +3462,18 @@ class MatplotlibCanvas(QWidgetMac):
       else:
         plotobject = self.residplotwidget; axisobject = self.ax_resid
       
+      # nothing to do if value is unchanged
       if(self.legendPlacement == value):
-        redraw = False
+        return
         
       self.legendPlacement = value
       if(self.legendVisible):
-        self.legendHelper(axisobject)
+        if((self.legendHandle != None) and (axisobject.get_legend() is self.legendHandle) and hasattr(self.legendHandle, 'set_loc')):
+          # move existing legend
+          self.legendHandle.set_loc(value)
+          self.styleLegend()
+        else:
+          self.legendHelper(axisobject)
         if(redraw):
           plotobject.myRefresh()
 
@@ -2975,8 +3486,9 @@ class MatplotlibCanvas(QWidgetMac):
       else:
         plotobject = self.residplotwidget; axisobject = self.ax_resid
       
+      # nothing to do if value is unchanged
       if(self.legendShadow == value):
-        redraw = False
+        return
         
       self.legendShadow = value
       if(self.legendVisible):
@@ -3000,6 +3512,7 @@ class MatplotlibCanvas(QWidgetMac):
         legend = axisobject.legend()
         if(legend != None):
           legend.remove()
+        self.legendHandle = None
         if('legend' in self.rememberSetting):
           del self.rememberSetting['legend']
       
@@ -3019,12 +3532,13 @@ class MatplotlibCanvas(QWidgetMac):
 
     # update color
     if(prop in ['face', 'edge']):
+      # nothing to do if value is unchanged
       if(self.legendColor[prop] == value):
-        redraw=False
+        return
         
       self.legendColor[prop] = value
       if(self.legendVisible):
-        self.legendHelper(axisobject)
+        self.restyleLegend(axisobject)
         if(redraw):
           plotobject.myRefresh()
 
@@ -3038,12 +3552,13 @@ class MatplotlibCanvas(QWidgetMac):
         plotobject = self.residplotwidget; axisobject = self.ax_resid
 
       # update color
+      # nothing to do if value is unchanged
       if(self.legendLabelColor == value):
-        redraw = False
+        return
         
       self.legendLabelColor = value
       if(self.legendVisible):
-        self.legendHelper(axisobject)
+        self.restyleLegend(axisobject)
         if(redraw):
           plotobject.myRefresh()
 
@@ -3056,13 +3571,15 @@ class MatplotlibCanvas(QWidgetMac):
         plotobject = self.residplotwidget; axisobject = self.ax_resid
 
       # sets legend edge width
+      # nothing to do if value is unchanged
       if(self.legendEdgeWidth == value):
-        redraw = False
+        return
         
       self.legendEdgeWidth = value
-      self.legendHelper(axisobject)
-      if(redraw):
-        plotobject.myRefresh()
+      if(self.legendVisible):
+        self.restyleLegend(axisobject)
+        if(redraw):
+          plotobject.myRefresh()
 
   def setLegendLabelSize(self, value=0.5, redraw=True, target='plot'):
     # check whether to operate on data or resid plot
@@ -3073,13 +3590,15 @@ class MatplotlibCanvas(QWidgetMac):
         plotobject = self.residplotwidget; axisobject = self.ax_resid
 
       # sets legend edge width
+      # nothing to do if value is unchanged
       if(self.legendLabelSize == value):
-        redraw = False
+        return
         
       self.legendLabelSize = value
-      self.legendHelper(axisobject)
-      if(redraw):
-        plotobject.myRefresh()
+      if(self.legendVisible):
+        self.restyleLegend(axisobject)
+        if(redraw):
+          plotobject.myRefresh()
 
   def setLegendLabelFont(self, value='DejaVu Sans', redraw=True, target='plot'):
     # check whether to operate on data or resid plot
@@ -3091,11 +3610,14 @@ class MatplotlibCanvas(QWidgetMac):
 
       # sets legend edge width
       prevFont = self.legendLabelFont
+      # nothing to do if value is unchanged
       if(self.legendLabelFont == value):
-        redraw = False
+        return
         
       self.legendLabelFont = value
-      self.legendHelper(axisobject)
+      if(not self.legendVisible):
+        return
+      self.restyleLegend(axisobject)
       
       # have to capture errors in case a strange font is set
       try:
@@ -3105,7 +3627,7 @@ class MatplotlibCanvas(QWidgetMac):
         self.parent.statusbar.showMessage('Experiencing problems setting font ' + self.legendLabelFont + ' -- reverting to ' + prevFont, self.parent.STATUS_TIME)
 
         self.legendLabelFont = prevFont
-        self.legendHelper(axisobject)
+        self.restyleLegend(axisobject)
         # also capture errors with previous font (can happen if selecting two bad fonts in a row)
         try:
           if(redraw):
@@ -3114,7 +3636,7 @@ class MatplotlibCanvas(QWidgetMac):
           safeFont = 'DejaVu Sans'
           self.parent.statusbar.showMessage('Also experiencing problems setting font ' + self.legendLabelFont + ' -- reverting to ' + safeFont, self.parent.STATUS_TIME)
           self.legendLabelFont = safeFont
-          self.legendHelper(axisobject)
+          self.restyleLegend(axisobject)
 
   def setDataAxisTicks(self, dataSet=0, redraw=True, target='plot'):
     # set x ticks to label values
@@ -3123,7 +3645,7 @@ class MatplotlibCanvas(QWidgetMac):
       xcol = roles.index('x')
       xval = list(useData[:, xcol])
       labels = list(self.parent.data[self.parent.activeData].getLabels())
-      minLength = np.min((len(xval), len(labels)))
+      minLength = min(len(xval), len(labels))
       if(minLength):
         # we have some labels to place
         if(target == 'plot'):
@@ -3132,25 +3654,29 @@ class MatplotlibCanvas(QWidgetMac):
           plotobject = self.residplotwidget; axisobject = self.ax_resid
 
         flag = False
-        labels = labels[:minLength]; xval = xval[:minLength]
+        # store labels as tuple of interned strings as these tend to repeat across data sets
+        labels = tuple([sys.intern(str(entry)) for entry in labels[:minLength]]); xval = xval[:minLength]
         
-        # first set new ticks
-        axisobject.xaxis.set_ticks(xval)
         lower, upper = self.minX, self.maxX
         if(len(xval)):
           # check for empty list
-          if(np.min(xval)<np.min((self.minX, self.maxX))):
+          minX, maxX = np.min(useData[:minLength, xcol]), np.max(useData[:minLength, xcol])
+          if(minX<(self.minX if (self.minX < self.maxX) else self.maxX)):
             flag = True
-            lower = np.min(xval)
-          if(np.max(xval)>np.max((self.minX, self.maxX))):
+            lower = minX
+          if(maxX>(self.minX if (self.minX > self.maxX) else self.maxX)):
             flag = True
-            upper = np.max(xval)
+            upper = maxX
           # special treatment for resid plot
           if(target == 'resid'):
             flag = True
             
-        # now set new tick labels
-        axisobject.xaxis.set_ticklabels(labels)
+        # now set new ticks and tick labels (in one go if supported)
+        if(TICKS_WITH_LABELS):
+          axisobject.xaxis.set_ticks(xval, labels=labels)
+        else:
+          axisobject.xaxis.set_ticks(xval)
+          axisobject.xaxis.set_ticklabels(labels)
         #nullLabels = matplotlib.ticker.NullFormatter()
         #formatterName = 'matplotlib.ticker.NullFormatter()'
         #axisobject.xaxis.set_minor_formatter(nullLabels)
@@ -3159,8 +3685,11 @@ class MatplotlibCanvas(QWidgetMac):
         self.ticksX = xval
         self.ticksXLabel = labels
         self.ticksXAuto = False
-        self.rememberSetting['ax_tickX'] = 'ax.xaxis.set_ticks(' + repr(list(xval)) + ')\n'
-        self.rememberSetting['ax_tickX'] += 'ax.xaxis.set_ticklabels(' + repr(list(labels)) + ')\n'
+        if(TICKS_WITH_LABELS):
+          self.rememberSetting['ax_tickX'] = 'ax.xaxis.set_ticks(' + repr(list(xval)) + ', labels=' + repr(list(labels)) + ')\n'
+        else:
+          self.rememberSetting['ax_tickX'] = 'ax.xaxis.set_ticks(' + repr(list(xval)) + ')\n'
+          self.rememberSetting['ax_tickX'] += 'ax.xaxis.set_ticklabels(' + repr(list(labels)) + ')\n'
         #self.rememberSetting['ax_tickX'] += 'ax.xaxis.set_minor_formatter(' + formatterName + ')\n'
 
         # check whether the new ticks necessitate axis rescaling
@@ -3265,12 +3794,12 @@ class MatplotlibCanvas(QWidgetMac):
         lower, upper = self.minX, self.maxX
         if(len(value)):
           # check for empty list
-          if(np.min(value)<np.min((self.minX, self.maxX))):
+          if(min(value)<(self.minX if (self.minX < self.maxX) else self.maxX)):
             flag = True
-            lower = np.min(value)
-          if(np.max(value)>np.max((self.minX, self.maxX))):
+            lower = min(value)
+          if(max(value)>(self.minX if (self.minX > self.maxX) else self.maxX)):
             flag = True
-            upper = np.max(value)
+            upper = max(value)
           # special treatment for resid plot
           if(target == 'resid'):
             flag = True
@@ -3293,12 +3822,12 @@ class MatplotlibCanvas(QWidgetMac):
         lower, upper = self.minY, self.maxY
         if(len(value)):
           # check for empty list
-          if(np.min(value)<np.min((self.minY, self.maxY))):
+          if(min(value)<(self.minY if (self.minY < self.maxY) else self.maxY)):
             flag = True
-            lower = np.min(value)
-          if(np.max(value)>np.max((self.minY, self.maxY))):
+            lower = min(value)
+          if(max(value)>(self.minY if (self.minY > self.maxY) else self.maxY)):
             flag = True
-            upper = np.max(value)
+            upper = max(value)
         self.ticksYAuto = False
       else:
         axisobject.yaxis.set_ticks(value)
@@ -3312,16 +3841,16 @@ class MatplotlibCanvas(QWidgetMac):
         lower, upper = self.minResidY, self.maxResidY
         if(len(value)):
           # check for empty list
-          if(np.min(value)<np.min((self.minResidY, self.maxResidY))):
+          if(min(value)<(self.minResidY if (self.minResidY < self.maxResidY) else self.maxResidY)):
             flag = True
-            lower = np.min(value)
-          if(np.max(value)>np.max((self.minResidY, self.maxResidY))):
+            lower = min(value)
+          if(max(value)>(self.minResidY if (self.minResidY > self.maxResidY) else self.maxResidY)):
             flag = True
-            upper = np.max(value)
+            upper = max(value)
         self.ticksResidYAuto = False
         
-      # check whether the new ticks necessitate axis rescaling
-      if(flag):
+      # check whether the new ticks necessitate axis rescaling (unless restoreState applies limits later on)
+      if(flag and (not self.deferRescale)):
         if((axis == 'y') or (axis == 'resid')):
           self.setAxisLimits(lower = lower, upper = upper, axis = axis, updateLabel = True, target=target, redraw=redraw)
         else:
@@ -3594,6 +4123,7 @@ class MatplotlibCanvas(QWidgetMac):
       elif(arrowhandle[axis] != None):
         arrowhandle[axis].remove()
         arrowhandle[axis] = None
+        self.updateHasArrows()
         if(redraw):
           plotobject.myRefresh()        
 
@@ -3770,10 +4300,15 @@ class MatplotlibCanvas(QWidgetMac):
         head_width=drawHeadWidth, head_length=drawHeadLength, overhang=drawOverhang, linewidth=drawLw,\
         linecolor=drawCol, fillcolor=drawFill, capstyle=drawCs, zorder=drawZ, logx=logx, logy=logy)
       arrowhandle[axis].set_clip_on(False)
+      self.hasArrows = True
 
       if(redraw):
         plotobject.myRefresh()
 
+  def updateHasArrows(self):
+    # keeps tabs on whether any axis arrows are drawn (queried upon each refresh)
+    self.hasArrows = any([i != None for i in list(self.handleArrow.values()) + list(self.handleArrowResid.values())])
+
   def drawMyArrow(self, axisobject, x, y, axis, head_width, head_length, overhang, linewidth, linecolor, fillcolor, capstyle, zorder, logx=False, logy=False):
     # draw customized arrow
     # calculate coordinates
@@ -5929,17 +6464,18 @@ class MatplotlibCanvas(QWidgetMac):
       self.setAxisLimits(lower = self.minX, upper = self.maxX, axis = 'x', updateLabel = False, target='resid', redraw=False)
       self.ax_resid.set_xscale(axis_mode)
       self.modeX = axis_mode
-      # trigger redrawing of fit function with new axis limits
-      if(self.modeX == 'linear'):
-        plot_interval = np.linspace(self.minX, self.maxX, self.DATAPOINTS_SIMULATION)
-      elif(self.modeX == 'log'):
-        plot_interval = np.linspace(np.log(self.minX), np.log(self.maxX), self.DATAPOINTS_SIMULATION)
-        plot_interval = np.exp(plot_interval)
-        
-      self.parent.fit[self.parent.activeFit].handlePlot = self.plotFunction(\
-        fitobject = self.parent.fit[self.parent.activeFit], x = plot_interval,\
-        handlePlot = self.parent.fit[self.parent.activeFit].handlePlot, redraw=False)
-      self.handleResidZero = self.plotResidZero(handleResidZero=self.handleResidZero, redraw=False)
+      # trigger redrawing of fit function with new axis limits (unless restoreState does this later on)
+      if(not self.deferRescale):
+        if(self.modeX == 'linear'):
+          plot_interval = np.linspace(self.minX, self.maxX, self.DATAPOINTS_SIMULATION)
+        elif(self.modeX == 'log'):
+          plot_interval = np.linspace(np.log(self.minX), np.log(self.maxX), self.DATAPOINTS_SIMULATION)
+          plot_interval = np.exp(plot_interval)
+          
+        self.parent.fit[self.parent.activeFit].handlePlot = self.plotFunction(\
+          fitobject = self.parent.fit[self.parent.activeFit], x = plot_interval,\
+          handlePlot = self.parent.fit[self.parent.activeFit].handlePlot, redraw=False)
+        self.handleResidZero = self.plotResidZero(handleResidZero=self.handleResidZero, redraw=False)
       # redraw
       if(redraw):
         self.dataplotwidget.myRefresh()
@@ -8289,6 +8825,13 @@ class DataObject(object):
         if(redraw):
           self.parent.plotArea.dataplotwidget.myRefresh()
 
+  def setStyles(self, styles, redraw=True):
+    # changes several style values at once and refreshes only once
+    for key in styles:
+      self.setStyle(key, styles[key], redraw=False)
+    if(redraw and len(styles) and (self.handleData != None)):
+      self.parent.plotArea.dataplotwidget.myRefresh()
+
   def getErrorStyle(self):
     # returns the style object
     return self.Errorstyle
@@ -8357,15 +8900,16 @@ class DataObject(object):
     # use this function to change the data value
     # check whether roles have been provided
     if(len(roles)):
-      if(('x' in roles) and ('y' in roles)):
-        self.x = data[:, roles.index('x')]
-        self.y = data[:, roles.index('y')]
-        if ('xerr' in roles):
-          self.xerr = data[:, roles.index('xerr')]
+      roleIndex = {role: index for index, role in enumerate(roles)}
+      if(('x' in roleIndex) and ('y' in roleIndex)):
+        self.x = data[:, roleIndex['x']]
+        self.y = data[:, roleIndex['y']]
+        if ('xerr' in roleIndex):
+          self.xerr = data[:, roleIndex['xerr']]
         else:
           self.xerr = np.array([])
-        if ('yerr' in roles):
-          self.yerr = data[:, roles.index('yerr')]
+        if ('yerr' in roleIndex):
+          self.yerr = data[:, roleIndex['yerr']]
         else:
           self.yerr = np.array([])
     else:
@@ -15000,20 +15544,16 @@ class Ui_MainWindow(object):
 
   def isNumber(self, s):
     # checks whether string is a number
-    try:
-      float(s)
+    if(isinstance(s, (int, float, np.integer, np.floating))):
       return True
-    except ValueError:
-      pass
-   
+    if(type(s) == str):
+      # regex match avoids raising exceptions for text entries
+      return bool(NUMBER_REGEX.match(s))
     try:
-      import unicodedata
-      unicodedata.numeric(s)
+      float(s)
       return True
     except (TypeError, ValueError):
-      pass
-    
-    return False
+      return False
 
 
 class MyForm(QtWidgets.QMainWindow):
@@ -15024,6 +15564,7 @@ class MyForm(QtWidgets.QMainWindow):
     self.targetDPI = 96
     actualDPI = QtGui.QPaintDevice.logicalDpiX(self)
     DPI_SCALING = 1.0 * actualDPI / self.targetDPI
+    scaledDPI.cache_clear()
     self.ui = Ui_MainWindow()
     self.ui.setupUi(MainWindow=self)
 
@@ -15068,8 +15609,9 @@ class MyForm(QtWidgets.QMainWindow):
       # close program on CTRL-Q
       self.ui.close()
     
+@lru_cache(maxsize=128)
 def scaledDPI(size):
-  # adjusts GUI dimensions to correct for DPI
+  # adjusts GUI dimensions to correct for DPI (cached as called with few distinct sizes)
   # implement check for array
   return int(size * DPI_SCALING)
 